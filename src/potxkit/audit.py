@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Any, Iterable
 
 from .package import OOXMLPackage
-from .rels import parse_relationships, rels_part_for
+from .rels import read_relationships, rels_part_for
 from .slide_index import slide_parts_in_order
 from .typography import extract_text_style_stats
 
@@ -167,7 +167,7 @@ def _slide_layout_part(pkg: OOXMLPackage, slide_part: str) -> str | None:
     rels_part = rels_part_for(slide_part)
     if not pkg.has_part(rels_part):
         return None
-    relationships = parse_relationships(pkg.read_part(rels_part))
+    relationships = read_relationships(pkg, rels_part)
     for rel in relationships:
         if rel.type.endswith("/slideLayout"):
             return _resolve_target(posixpath.dirname(slide_part), rel.target)
@@ -176,13 +176,13 @@ def _slide_layout_part(pkg: OOXMLPackage, slide_part: str) -> str | None:
 
 def _layout_master_map(pkg: OOXMLPackage) -> dict[str, str]:
     mapping: dict[str, str] = {}
-    for part in pkg.list_parts():
-        if not part.startswith("ppt/slideLayouts/") or not part.endswith(".xml"):
+    for part in pkg.parts_under("ppt/slideLayouts/"):
+        if not part.endswith(".xml"):
             continue
         rels_part = rels_part_for(part)
         if not pkg.has_part(rels_part):
             continue
-        relationships = parse_relationships(pkg.read_part(rels_part))
+        relationships = read_relationships(pkg, rels_part)
         for rel in relationships:
             if rel.type.endswith("/slideMaster"):
                 mapping[part] = _resolve_target(posixpath.dirname(part), rel.target)
@@ -192,8 +192,8 @@ def _layout_master_map(pkg: OOXMLPackage) -> dict[str, str]:
 
 def _summarize_parts(pkg: OOXMLPackage, prefix: str) -> dict[str, dict[str, Any]]:
     summary: dict[str, dict[str, Any]] = {}
-    for part in pkg.list_parts():
-        if not part.startswith(prefix) or not part.endswith(".xml"):
+    for part in pkg.parts_under(prefix):
+        if not part.endswith(".xml"):
             continue
         root = ET.fromstring(pkg.read_part(part))
         summary[part] = {
@@ -290,9 +290,7 @@ def _normalize_group_by(value: Iterable[str] | None) -> list[str]:
 
 def _theme_summary(pkg: OOXMLPackage) -> dict[str, str] | None:
     theme_parts = [
-        part
-        for part in pkg.list_parts()
-        if part.startswith("ppt/theme/") and part.endswith(".xml")
+        part for part in pkg.parts_under("ppt/theme/") if part.endswith(".xml")
     ]
     if not theme_parts:
         return None
@@ -7,9 +7,8 @@ from .audit import audit_package
 from .layout_ops import (
     apply_palette_to_part,
     assign_slides_to_layout,
+    edit_part_formatting,
     make_layout_from_slide,
-    strip_colors_from_part,
-    strip_fonts_from_part,
 )
 from .package import OOXMLPackage
 
@@ -56,10 +55,9 @@ def auto_layout(
         if strip_colors or strip_fonts:
             for slide_num in slides:
                 slide_part = _slide_part_for_number(pkg, slide_num)
-                if strip_colors:
-                    strip_colors_from_part(pkg, slide_part)
-                if strip_fonts:
-                    strip_fonts_from_part(pkg, slide_part)
+                edit_part_formatting(
+                    pkg, slide_part, strip_colors=strip_colors, strip_fonts=strip_fonts
+                )
 
     return AutoLayoutResult(created_layouts=created, group_count=len(report.groups))
 
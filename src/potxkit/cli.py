@@ -12,26 +12,23 @@ from .auto_layout import auto_layout
 from .dump_tree import DumpTreeOptions, dump_tree, summarize_tree
 from .layout_ops import (
     add_layout_image_shape,
-    apply_palette_to_part,
     assign_slides_to_layout,
+    edit_part_formatting,
     make_layout_from_slide,
     prune_unused_layouts,
     reindex_layouts,
     resolve_layout_part,
     resolve_master_part,
-    set_font_family_for_part,
     set_layout_background_image,
     set_layout_text_styles_for_part,
     set_master_text_styles_for_part,
     slide_size,
-    strip_colors_from_part,
-    strip_fonts_from_part,
 )
 from .normalize import NormalizeResult, normalize_slide_colors, parse_slide_numbers
 from .package import OOXMLPackage
 from .sanitize import sanitize_slides
-from .slide_index import slide_parts_in_order
-from .storage import read_bytes, write_bytes
+from .slide_index import select_slide_parts
+from .storage import read_bytes, save_package
 from .typography import detect_placeholder_styles
 
 
@@ -495,18 +492,18 @@ def _handle_normalize(args: argparse.Namespace) -> int:
     data = read_bytes(args.input_path) if args.input_path else None
     if data is None:
         tpl = PotxTemplate.new()
-        pkg = tpl._package
+        pkg = tpl.package
     else:
         pkg = OOXMLPackage(data)
 
     slide_numbers = parse_slide_numbers(args.slides) if args.slides else None
     result = normalize_slide_colors(pkg, mapping, slide_numbers)
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     _print_normalize_result(result)
 
     if args.report:
         with open(args.report, "w", encoding="utf-8") as handle:
-            json.dump(_normalize_report(result), handle, indent=2)
+            json.dump(result.as_dict(), handle, indent=2)
         print(f"Wrote {args.report}")
 
     return 0
@@ -636,19 +633,19 @@ def _handle_set_master(args: argparse.Namespace) -> int:
         print(str(exc))
         return 2
     data = read_bytes(args.input_path) if args.input_path else None
-    pkg = OOXMLPackage(data) if data else PotxTemplate.new()._package
+    pkg = OOXMLPackage(data) if data else PotxTemplate.new().package
 
     master_part = resolve_master_part(pkg, str(args.master))
     _apply_palette_and_fonts(pkg, master_part, args)
 
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     return 0
 
 
 def _handle_make_layout(args: argparse.Namespace) -> int:
     data = read_bytes(args.input_path) if args.input_path else None
-    pkg = OOXMLPackage(data) if data else PotxTemplate.new()._package
+    pkg = OOXMLPackage(data) if data else PotxTemplate.new().package
 
     new_layout = make_layout_from_slide(
         pkg,
@@ -660,7 +657,7 @@ def _handle_make_layout(args: argparse.Namespace) -> int:
         slides = parse_slide_numbers(args.assign_slides)
         assign_slides_to_layout(pkg, slides, new_layout)
 
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     print(f"Layout created: {new_layout}")
     return 0
@@ -673,12 +670,12 @@ def _handle_set_layout(args: argparse.Namespace) -> int:
         print(str(exc))
         return 2
     data = read_bytes(args.input_path) if args.input_path else None
-    pkg = OOXMLPackage(data) if data else PotxTemplate.new()._package
+    pkg = OOXMLPackage(data) if data else PotxTemplate.new().package
 
     layout_part = resolve_layout_part(pkg, args.layout)
     _apply_palette_and_fonts(pkg, layout_part, args)
 
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     return 0
 
@@ -693,13 +690,13 @@ def _handle_set_slide(args: argparse.Namespace) -> int:
         print("Provide --slide or --slides.")
         return 2
     data = read_bytes(args.input_path) if args.input_path else None
-    pkg = OOXMLPackage(data) if data else PotxTemplate.new()._package
+    pkg = OOXMLPackage(data) if data else PotxTemplate.new().package
 
     if args.slides:
         slide_numbers = parse_slide_numbers(args.slides)
     else:
         slide_numbers = parse_slide_numbers(str(args.slide))
-    slide_parts = _slide_parts_for_numbers(pkg, slide_numbers)
+    slide_parts = select_slide_parts(pkg, slide_numbers)
 
     for slide_part in slide_parts:
         _apply_palette_and_fonts(pkg, slide_part, args)
@@ -708,7 +705,7 @@ def _handle_set_slide(args: argparse.Namespace) -> int:
         layout_part = resolve_layout_part(pkg, args.layout)
         assign_slides_to_layout(pkg, slide_numbers, layout_part)
 
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     return 0
 
@@ -725,7 +722,7 @@ def _handle_set_text_styles(args: argparse.Namespace) -> int:
         return 2
 
     data = read_bytes(args.input_path) if args.input_path else None
-    pkg = OOXMLPackage(data) if data else PotxTemplate.new()._package
+    pkg = OOXMLPackage(data) if data else PotxTemplate.new().package
 
     title_size = args.title_size
     body_size = args.body_size
@@ -744,7 +741,7 @@ def _handle_set_text_styles(args: argparse.Namespace) -> int:
             body_bold = bool(body.get("bold"))
 
     if args.from_slide:
-        slide_part = _slide_parts_for_numbers(pkg, {args.from_slide})[0]
+        slide_part = select_slide_parts(pkg, [args.from_slide])[0]
         slide_root = ET.fromstring(pkg.read_part(slide_part))
         detected = detect_placeholder_styles(slide_root)
         if title_size is None and detected.get("title", {}).get("size_pt") is not None:
@@ -767,7 +764,7 @@ def _handle_set_text_styles(args: argparse.Namespace) -> int:
             pkg, master_part, title_size, title_bold, body_size, body_bold
         )
 
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     return 0
 
@@ -782,23 +779,23 @@ def _load_styles(path: str) -> dict[str, Any]:
 
 def _handle_set_layout_bg(args: argparse.Namespace) -> int:
     data = read_bytes(args.input_path) if args.input_path else None
-    pkg = OOXMLPackage(data) if data else PotxTemplate.new()._package
+    pkg = OOXMLPackage(data) if data else PotxTemplate.new().package
     layout_part = resolve_layout_part(pkg, args.layout)
     set_layout_background_image(pkg, layout_part, args.image)
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     return 0
 
 
 def _handle_set_layout_image(args: argparse.Namespace) -> int:
     data = read_bytes(args.input_path) if args.input_path else None
-    pkg = OOXMLPackage(data) if data else PotxTemplate.new()._package
+    pkg = OOXMLPackage(data) if data else PotxTemplate.new().package
     layout_part = resolve_layout_part(pkg, args.layout)
 
     cx, cy = slide_size(pkg)
     x, y, w, h = _resolve_image_box(args, cx, cy)
     add_layout_image_shape(pkg, layout_part, args.image, x, y, w, h, args.name)
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     return 0
 
@@ -812,7 +809,7 @@ def _handle_prune_layouts(args: argparse.Namespace) -> int:
         keep_layouts.add(resolve_layout_part(pkg, selector))
 
     result = prune_unused_layouts(pkg, keep_layouts=keep_layouts or None)
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     print(f"Layouts removed: {len(result.removed_layouts)}")
     return 0
@@ -822,7 +819,7 @@ def _handle_reindex_layouts(args: argparse.Namespace) -> int:
     data = read_bytes(args.input_path)
     pkg = OOXMLPackage(data)
     result = reindex_layouts(pkg)
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     print(f"Layouts remapped: {len(result.layout_mapping)}")
     return 0
@@ -833,7 +830,7 @@ def _handle_sanitize(args: argparse.Namespace) -> int:
     pkg = OOXMLPackage(data)
     slide_numbers = parse_slide_numbers(args.slides) if args.slides else None
     result = sanitize_slides(pkg, slide_numbers)
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     print(
         f"Slides updated: {result.slides_updated} "
@@ -904,7 +901,7 @@ def _handle_auto_layout(args: argparse.Namespace) -> int:
         strip_fonts=args.strip_fonts,
         palette=palette,
     )
-    write_bytes(args.output, pkg.save_bytes())
+    save_package(pkg, args.output)
     print(f"Wrote {args.output}")
     print(f"Layouts created: {len(result.created_layouts)}")
     return 0
@@ -965,15 +962,14 @@ def _theme_to_json(tpl: PotxTemplate) -> dict[str, Any]:
 def _apply_palette_and_fonts(
     pkg: OOXMLPackage, part: str, args: argparse.Namespace
 ) -> None:
-    if args.palette:
-        mapping = _load_mapping(args.palette)
-        apply_palette_to_part(pkg, part, mapping)
-    if args.palette_none:
-        strip_colors_from_part(pkg, part)
-    if args.font:
-        set_font_family_for_part(pkg, part, args.font)
-    if args.fonts_none:
-        strip_fonts_from_part(pkg, part)
+    edit_part_formatting(
+        pkg,
+        part,
+        palette=_load_mapping(args.palette) if args.palette else None,
+        strip_colors=args.palette_none,
+        font=args.font,
+        strip_fonts=args.fonts_none,
+    )
 
 
 def _validate_palette_font_args(args: argparse.Namespace) -> None:
@@ -983,16 +979,6 @@ def _validate_palette_font_args(args: argparse.Namespace) -> None:
         raise ValueError("Use either --font or --fonts-none, not both.")
 
 
-def _slide_parts_for_numbers(pkg: OOXMLPackage, slide_numbers: set[int]) -> list[str]:
-    parts = slide_parts_in_order(pkg)
-    selected = []
-    for num in sorted(slide_numbers):
-        if num < 1 or num > len(parts):
-            raise ValueError("Slide number out of range")
-        selected.append(parts[num - 1])
-    return selected
-
-
 def _resolve_image_box(
     args: argparse.Namespace, cx: int, cy: int
 ) -> tuple[int, int, int, int]:
@@ -1040,15 +1026,6 @@ def _example_palette() -> dict[str, Any]:
     }
 
 
-def _normalize_report(result: NormalizeResult) -> dict[str, Any]:
-    return {
-        "slides_total": result.slides_total,
-        "slides_touched": result.slides_touched,
-        "replacements": result.replacements,
-        "per_slide": result.per_slide,
-    }
-
-
 def _audit_report(report: AuditReport) -> dict[str, Any]:
     return {
         "slides_total": report.slides_total,
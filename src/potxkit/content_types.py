@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import io
 import xml.etree.ElementTree as ET
 
 from .package import OOXMLPackage
+from .xmlutil import serialize_xml
 
 CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+_OVERRIDE = f"{{{CT_NS}}}Override"
 
 
 class ContentTypes:
@@ -17,12 +22,12 @@ class ContentTypes:
 
     def ensure_override(self, part_name: str, content_type: str) -> bool:
         part = _normalize_part_name(part_name)
-        for override in self._root.findall(f"{{{CT_NS}}}Override"):
+        for override in self._root.findall(_OVERRIDE):
             if override.attrib.get("PartName") == part:
                 return False
         ET.SubElement(
             self._root,
-            f"{{{CT_NS}}}Override",
+            _OVERRIDE,
             {"PartName": part, "ContentType": content_type},
         )
         return True
@@ -30,55 +35,65 @@ class ContentTypes:
     def remove_override(self, part_name: str) -> bool:
         part = _normalize_part_name(part_name)
         removed = False
-        for override in list(self._root.findall(f"{{{CT_NS}}}Override")):
+        for override in list(self._root.findall(_OVERRIDE)):
             if override.attrib.get("PartName") == part:
                 self._root.remove(override)
                 removed = True
         return removed
 
     def to_bytes(self) -> bytes:
-        return ET.tostring(self._root, encoding="utf-8", xml_declaration=True)
+        return serialize_xml(self._root)
 
 
 def ensure_override(pkg: OOXMLPackage, part_name: str, content_type: str) -> bool:
-    if not pkg.has_part("[Content_Types].xml"):
+    if not pkg.has_part(CONTENT_TYPES_PART):
         raise KeyError("[Content_Types].xml not found")
-    ct = ContentTypes.from_bytes(pkg.read_part("[Content_Types].xml"))
+    if _normalize_part_name(part_name) in _override_names(pkg):
+        return False
+    ct = ContentTypes.from_bytes(pkg.read_part(CONTENT_TYPES_PART))
     changed = ct.ensure_override(part_name, content_type)
     if changed:
-        pkg.write_part("[Content_Types].xml", ct.to_bytes())
+        pkg.write_part(CONTENT_TYPES_PART, ct.to_bytes())
     return changed
 
 
 def remove_override(pkg: OOXMLPackage, part_name: str) -> bool:
-    if not pkg.has_part("[Content_Types].xml"):
+    if not pkg.has_part(CONTENT_TYPES_PART):
         return False
-    ct = ContentTypes.from_bytes(pkg.read_part("[Content_Types].xml"))
+    ct = ContentTypes.from_bytes(pkg.read_part(CONTENT_TYPES_PART))
     changed = ct.remove_override(part_name)
     if changed:
-        pkg.write_part("[Content_Types].xml", ct.to_bytes())
+        pkg.write_part(CONTENT_TYPES_PART, ct.to_bytes())
     return changed
 
 
 def ensure_default(pkg: OOXMLPackage, extension: str, content_type: str) -> bool:
-    if not pkg.has_part("[Content_Types].xml"):
+    if not pkg.has_part(CONTENT_TYPES_PART):
         raise KeyError("[Content_Types].xml not found")
-    ct = ContentTypes.from_bytes(pkg.read_part("[Content_Types].xml"))
+    ct = ContentTypes.from_bytes(pkg.read_part(CONTENT_TYPES_PART))
     changed = _ensure_default_element(ct, extension, content_type)
     if changed:
-        pkg.write_part("[Content_Types].xml", ct.to_bytes())
+        pkg.write_part(CONTENT_TYPES_PART, ct.to_bytes())
     return changed
 
 
 def has_override(pkg: OOXMLPackage, part_name: str) -> bool:
-    if not pkg.has_part("[Content_Types].xml"):
+    if not pkg.has_part(CONTENT_TYPES_PART):
         return False
-    ct = ContentTypes.from_bytes(pkg.read_part("[Content_Types].xml"))
-    part = _normalize_part_name(part_name)
-    for override in ct._root.findall(f"{{{CT_NS}}}Override"):
-        if override.attrib.get("PartName") == part:
-            return True
-    return False
+    return _normalize_part_name(part_name) in _override_names(pkg)
+
+
+def _override_names(pkg: OOXMLPackage) -> frozenset[str]:
+    def build() -> frozenset[str]:
+        names = set()
+        data = io.BytesIO(pkg.read_part(CONTENT_TYPES_PART))
+        for _, node in ET.iterparse(data):
+            if node.tag == _OVERRIDE:
+                names.add(node.attrib.get("PartName", ""))
+            node.clear()
+        return frozenset(names)
+
+    return pkg.cached(CONTENT_TYPES_PART, "overrides", build)
 
 
 def _normalize_part_name(part_name: str) -> str:
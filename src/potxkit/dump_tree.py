@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import copy
 import posixpath
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from typing import Any, Iterable
 
+from .formatting import run_properties
 from .package import OOXMLPackage
-from .rels import parse_relationships, rels_part_for
-from .slide_index import slide_parts_in_order
+from .rels import read_relationships, rels_part_for
+from .slide_index import select_slide_parts, slide_parts_in_order
+from .xmlutil import find_path
 
 P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
 A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
@@ -15,6 +18,45 @@ R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 
 NS = {"p": P_NS, "a": A_NS, "r": R_NS}
 
+_CLR_MAP = f"{{{P_NS}}}clrMap"
+_CLR_MAP_OVR = f"{{{P_NS}}}clrMapOvr"
+_CSLD = f"{{{P_NS}}}cSld"
+_BG = f"{{{P_NS}}}bg"
+_BG_PR = f"{{{P_NS}}}bgPr"
+_SP_TREE = f"{{{P_NS}}}spTree"
+_GRP_SP = f"{{{P_NS}}}grpSp"
+_NV_SP_PR = f"{{{P_NS}}}nvSpPr"
+_NV_PIC_PR = f"{{{P_NS}}}nvPicPr"
+_NV_GRAPHIC_FRAME_PR = f"{{{P_NS}}}nvGraphicFramePr"
+_NV_GRP_SP_PR = f"{{{P_NS}}}nvGrpSpPr"
+_C_NV_PR = f"{{{P_NS}}}cNvPr"
+_NV_PR = f"{{{P_NS}}}nvPr"
+_PH = f"{{{P_NS}}}ph"
+_SP_PR = f"{{{P_NS}}}spPr"
+_P_TX_BODY = f"{{{P_NS}}}txBody"
+_P_BLIP_FILL = f"{{{P_NS}}}blipFill"
+_BLIP = f"{{{A_NS}}}blip"
+_GRAPHIC = f"{{{A_NS}}}graphic"
+_GRAPHIC_DATA = f"{{{A_NS}}}graphicData"
+_PARAGRAPH = f"{{{A_NS}}}p"
+_RUN = f"{{{A_NS}}}r"
+_LST_STYLE = f"{{{A_NS}}}lstStyle"
+_SOLID_FILL = f"{{{A_NS}}}solidFill"
+_GRAD_FILL = f"{{{A_NS}}}gradFill"
+_GS_LST = f"{{{A_NS}}}gsLst"
+_GS = f"{{{A_NS}}}gs"
+_A_BLIP_FILL = f"{{{A_NS}}}blipFill"
+_PATT_FILL = f"{{{A_NS}}}pattFill"
+_NO_FILL = f"{{{A_NS}}}noFill"
+_LATIN = f"{{{A_NS}}}latin"
+_R_EMBED = f"{{{R_NS}}}embed"
+_COLOR_KINDS = tuple(
+    (kind, f"{{{A_NS}}}{kind}")
+    for kind in ("srgbClr", "schemeClr", "sysClr", "prstClr")
+)
+
+_SUMMARY_LAYERS = ("slideMaster", "slideLayout", "local")
+
 
 @dataclass
 class DumpTreeOptions:
@@ -30,16 +72,21 @@ def dump_tree(
     options: DumpTreeOptions | None = None,
 ) -> dict[str, Any]:
     opts = options or DumpTreeOptions()
-    slide_parts = slide_parts_in_order(pkg)
-
     if slide_numbers is not None:
-        requested = {num for num in slide_numbers}
-        selected = []
-        for num in sorted(requested):
-            if num < 1 or num > len(slide_parts):
-                raise ValueError("Slide number out of range")
-            selected.append(slide_parts[num - 1])
-        slide_parts = selected
+        slide_parts = select_slide_parts(pkg, slide_numbers)
+    else:
+        slide_parts = slide_parts_in_order(pkg)
+
+    layers: dict[str, dict[str, Any]] = {}
+
+    def layer(part: str) -> dict[str, Any]:
+        if part not in layers:
+            layers[part] = _collect_layer(
+                ET.fromstring(pkg.read_part(part)),
+                include_text=opts.include_text,
+                part=part,
+            )
+        return copy.deepcopy(layers[part])
 
     slides = []
     for idx, slide_part in enumerate(slide_parts, start=1):
@@ -56,15 +103,9 @@ def dump_tree(
                 "local": _collect_layer(slide_root, include_text=opts.include_text),
             }
             if opts.include_layout and layout_part:
-                layout_root = ET.fromstring(pkg.read_part(layout_part))
-                entry["slideLayout"] = _collect_layer(
-                    layout_root, include_text=opts.include_text, part=layout_part
-                )
+                entry["slideLayout"] = layer(layout_part)
             if opts.include_master and master_part:
-                master_root = ET.fromstring(pkg.read_part(master_part))
-                entry["slideMaster"] = _collect_layer(
-                    master_root, include_text=opts.include_text, part=master_part
-                )
+                entry["slideMaster"] = layer(master_part)
             slides.append(entry)
             continue
 
@@ -75,20 +116,14 @@ def dump_tree(
             "master": master_part,
             "background": _extract_background(slide_root),
             "shapes": _extract_shapes(slide_root, include_text=opts.include_text),
-            "has_clrMapOvr": slide_root.find("p:clrMapOvr", NS) is not None,
+            "has_clrMapOvr": slide_root.find(_CLR_MAP_OVR) is not None,
         }
 
         if opts.include_layout and layout_part:
-            layout_root = ET.fromstring(pkg.read_part(layout_part))
-            slide_entry["layout_tree"] = _collect_layer(
-                layout_root, include_text=opts.include_text, part=layout_part
-            )
+            slide_entry["layout_tree"] = layer(layout_part)
 
         if opts.include_master and master_part:
-            master_root = ET.fromstring(pkg.read_part(master_part))
-            slide_entry["master_tree"] = _collect_layer(
-                master_root, include_text=opts.include_text, part=master_part
-            )
+            slide_entry["master_tree"] = layer(master_part)
 
         slides.append(slide_entry)
 
@@ -97,26 +132,39 @@ def dump_tree(
 
 def summarize_tree(payload: dict[str, Any], *, local_only: bool = False) -> list[str]:
     lines: list[str] = []
+    layer_lines: dict[tuple[str, str], str] = {}
     slides = payload.get("slides", [])
     for slide in slides:
         if local_only and not _slide_has_local_hardcoded(slide):
             continue
         lines.append(f"slide {slide.get('slide')}:")
-        for key in ["slideMaster", "slideLayout", "local"]:
+        for key in _SUMMARY_LAYERS:
             if key not in slide:
                 continue
-            summary = _summarize_layer(slide[key])
-            line = (
-                f"  {key}: bg={summary['bg']} "
-                f"fills(hard={summary['shape_fill_hard']}, theme={summary['shape_fill_theme']}) "
-                f"text(hard={summary['text_color_hard']}, theme={summary['text_color_theme']}) "
-                f"fonts={summary['fonts']} sizes={summary['sizes']} "
-                f"clrMap={summary['clrmap']}"
-            )
+            layer = slide[key]
+            part = layer.get("part")
+            if part is None:
+                lines.append(_layer_line(key, layer))
+                continue
+            cache_key = (key, part)
+            line = layer_lines.get(cache_key)
+            if line is None:
+                line = layer_lines[cache_key] = _layer_line(key, layer)
             lines.append(line)
     return lines
 
 
+def _layer_line(key: str, layer: dict[str, Any]) -> str:
+    summary = _summarize_layer(layer)
+    return (
+        f"  {key}: bg={summary['bg']} "
+        f"fills(hard={summary['shape_fill_hard']}, theme={summary['shape_fill_theme']}) "
+        f"text(hard={summary['text_color_hard']}, theme={summary['text_color_theme']}) "
+        f"fonts={summary['fonts']} sizes={summary['sizes']} "
+        f"clrMap={summary['clrmap']}"
+    )
+
+
 def _collect_layer(
     root: ET.Element, *, include_text: bool, part: str | None = None
 ) -> dict[str, Any]:
@@ -125,8 +173,8 @@ def _collect_layer(
         "name": _part_basename(part) if part else None,
         "background": _extract_background(root),
         "shapes": _extract_shapes(root, include_text=include_text),
-        "has_clrMap": root.find(".//p:clrMap", NS) is not None,
-        "has_clrMapOvr": root.find(".//p:clrMapOvr", NS) is not None,
+        "has_clrMap": next(root.iter(_CLR_MAP), None) is not None,
+        "has_clrMapOvr": next(root.iter(_CLR_MAP_OVR), None) is not None,
     }
     return data
 
@@ -135,7 +183,7 @@ def _slide_layout_part(pkg: OOXMLPackage, slide_part: str) -> str | None:
     rels_part = rels_part_for(slide_part)
     if not pkg.has_part(rels_part):
         return None
-    relationships = parse_relationships(pkg.read_part(rels_part))
+    relationships = read_relationships(pkg, rels_part)
     for rel in relationships:
         if rel.type.endswith("/slideLayout"):
             return _resolve_target(posixpath.dirname(slide_part), rel.target)
@@ -148,7 +196,7 @@ def _layout_master_part(pkg: OOXMLPackage, layout_part: str | None) -> str | Non
     rels_part = rels_part_for(layout_part)
     if not pkg.has_part(rels_part):
         return None
-    relationships = parse_relationships(pkg.read_part(rels_part))
+    relationships = read_relationships(pkg, rels_part)
     for rel in relationships:
         if rel.type.endswith("/slideMaster"):
             return _resolve_target(posixpath.dirname(layout_part), rel.target)
@@ -162,7 +210,7 @@ def _resolve_target(base_dir: str, target: str) -> str:
 
 
 def _extract_background(root: ET.Element) -> dict[str, Any] | None:
-    bg_pr = root.find("p:cSld/p:bg/p:bgPr", NS)
+    bg_pr = find_path(root, _CSLD, _BG, _BG_PR)
     if bg_pr is None:
         return None
     fill = _extract_fill(bg_pr)
@@ -170,10 +218,10 @@ def _extract_background(root: ET.Element) -> dict[str, Any] | None:
 
 
 def _extract_shapes(root: ET.Element, *, include_text: bool) -> list[dict[str, Any]]:
-    sp_tree = root.find("p:cSld/p:spTree", NS)
+    sp_tree = find_path(root, _CSLD, _SP_TREE)
     if sp_tree is None:
         return []
-    return [_extract_shape(node, include_text=include_text) for node in list(sp_tree)]
+    return [_extract_shape(node, include_text=include_text) for node in sp_tree]
 
 
 def _extract_shape(node: ET.Element, *, include_text: bool) -> dict[str, Any]:
@@ -190,32 +238,32 @@ def _extract_shape(node: ET.Element, *, include_text: bool) -> dict[str, Any]:
 
 
 def _extract_sp(node: ET.Element, *, include_text: bool) -> dict[str, Any]:
-    c_nv_pr = node.find("p:nvSpPr/p:cNvPr", NS)
+    c_nv_pr = find_path(node, _NV_SP_PR, _C_NV_PR)
     info = _shape_identity(c_nv_pr)
-    ph = node.find("p:nvSpPr/p:nvPr/p:ph", NS)
+    ph = find_path(node, _NV_SP_PR, _NV_PR, _PH)
     if ph is not None:
         info["placeholder"] = {
             "type": ph.attrib.get("type"),
             "idx": ph.attrib.get("idx"),
         }
-    sp_pr = node.find("p:spPr", NS)
+    sp_pr = node.find(_SP_PR)
     if sp_pr is not None:
         fill = _extract_fill(sp_pr)
         if fill:
             info["fill"] = fill
     if include_text:
-        tx_body = node.find("p:txBody", NS)
+        tx_body = node.find(_P_TX_BODY)
         if tx_body is not None:
             info["text"] = _extract_text_info(tx_body)
     return {"type": "shape", **info}
 
 
 def _extract_pic(node: ET.Element) -> dict[str, Any]:
-    c_nv_pr = node.find("p:nvPicPr/p:cNvPr", NS)
+    c_nv_pr = find_path(node, _NV_PIC_PR, _C_NV_PR)
     info = _shape_identity(c_nv_pr)
-    blip = node.find("p:blipFill/a:blip", NS)
+    blip = find_path(node, _P_BLIP_FILL, _BLIP)
     if blip is not None:
-        embed = blip.attrib.get(f"{{{R_NS}}}embed")
+        embed = blip.attrib.get(_R_EMBED)
         if embed:
             info["embed"] = embed
     fill = _extract_fill(node)
@@ -225,23 +273,22 @@ def _extract_pic(node: ET.Element) -> dict[str, Any]:
 
 
 def _extract_graphic_frame(node: ET.Element) -> dict[str, Any]:
-    c_nv_pr = node.find("p:nvGraphicFramePr/p:cNvPr", NS)
+    c_nv_pr = find_path(node, _NV_GRAPHIC_FRAME_PR, _C_NV_PR)
     info = _shape_identity(c_nv_pr)
-    graphic = node.find("a:graphic/a:graphicData", NS)
+    graphic = find_path(node, _GRAPHIC, _GRAPHIC_DATA)
     if graphic is not None:
         info["graphic_uri"] = graphic.attrib.get("uri")
     return {"type": "graphicFrame", **info}
 
 
 def _extract_group(node: ET.Element, *, include_text: bool) -> dict[str, Any]:
-    c_nv_pr = node.find("p:nvGrpSpPr/p:cNvPr", NS)
+    c_nv_pr = find_path(node, _NV_GRP_SP_PR, _C_NV_PR)
     info = _shape_identity(c_nv_pr)
-    children_tree = node.find("p:grpSp/p:spTree", NS)
+    children_tree = find_path(node, _GRP_SP, _SP_TREE)
     children = []
     if children_tree is not None:
         children = [
-            _extract_shape(child, include_text=include_text)
-            for child in list(children_tree)
+            _extract_shape(child, include_text=include_text) for child in children_tree
         ]
     return {"type": "group", **info, "children": children}
 
@@ -253,8 +300,8 @@ def _shape_identity(c_nv_pr: ET.Element | None) -> dict[str, Any]:
 
 
 def _extract_text_info(tx_body: ET.Element) -> dict[str, Any]:
-    paragraphs = tx_body.findall("a:p", NS)
-    runs = tx_body.findall(".//a:r", NS)
+    paragraphs = tx_body.findall(_PARAGRAPH)
+    runs = list(tx_body.iter(_RUN))
     colors = _extract_color_nodes(tx_body)
     fonts = _extract_text_fonts(tx_body)
     sizes = _extract_text_sizes(tx_body)
@@ -264,31 +311,32 @@ def _extract_text_info(tx_body: ET.Element) -> dict[str, Any]:
         "colors": colors,
         "fonts": fonts,
         "sizes_pt": sizes,
-        "has_lstStyle": tx_body.find("a:lstStyle", NS) is not None,
+        "has_lstStyle": tx_body.find(_LST_STYLE) is not None,
     }
 
 
 def _extract_fill(node: ET.Element) -> dict[str, Any] | None:
-    solid = node.find("a:solidFill", NS)
+    solid = node.find(_SOLID_FILL)
     if solid is not None:
         return {"type": "solid", "color": _extract_color(solid)}
 
-    grad = node.find("a:gradFill", NS)
+    grad = node.find(_GRAD_FILL)
     if grad is not None:
         stops = []
-        for gs in grad.findall("a:gsLst/a:gs", NS):
+        gs_lst = grad.find(_GS_LST)
+        for gs in gs_lst.findall(_GS) if gs_lst is not None else ():
             stops.append({"pos": gs.attrib.get("pos"), "color": _extract_color(gs)})
         return {"type": "gradient", "stops": stops}
 
-    blip = node.find("a:blipFill", NS)
+    blip = node.find(_A_BLIP_FILL)
     if blip is not None:
         return {"type": "image"}
 
-    patt = node.find("a:pattFill", NS)
+    patt = node.find(_PATT_FILL)
     if patt is not None:
         return {"type": "pattern", "colors": _extract_color_nodes(patt)}
 
-    if node.find("a:noFill", NS) is not None:
+    if node.find(_NO_FILL) is not None:
         return {"type": "none"}
 
     return None
@@ -296,8 +344,8 @@ def _extract_fill(node: ET.Element) -> dict[str, Any] | None:
 
 def _extract_color_nodes(node: ET.Element) -> list[dict[str, Any]]:
     colors = []
-    for tag in ["srgbClr", "schemeClr", "sysClr", "prstClr"]:
-        for color in node.findall(f".//a:{tag}", NS):
+    for tag, clark in _COLOR_KINDS:
+        for color in node.iter(clark):
             entry = {"kind": tag, "value": color.attrib.get("val")}
             if tag == "sysClr" and "lastClr" in color.attrib:
                 entry["lastClr"] = color.attrib.get("lastClr")
@@ -306,8 +354,8 @@ def _extract_color_nodes(node: ET.Element) -> list[dict[str, Any]]:
 
 
 def _extract_color(node: ET.Element) -> dict[str, Any] | None:
-    for tag in ["srgbClr", "schemeClr", "sysClr", "prstClr"]:
-        child = node.find(f"a:{tag}", NS)
+    for tag, clark in _COLOR_KINDS:
+        child = node.find(clark)
         if child is None:
             continue
         entry = {"kind": tag, "value": child.attrib.get("val")}
@@ -331,8 +379,8 @@ def _part_basename(part: str | None) -> str | None:
 
 def _extract_text_fonts(tx_body: ET.Element) -> list[dict[str, Any]]:
     counts: dict[str, int] = {}
-    for rpr in tx_body.findall(".//a:rPr", NS) + tx_body.findall(".//a:defRPr", NS):
-        latin = rpr.find("a:latin", NS)
+    for rpr in run_properties(tx_body):
+        latin = rpr.find(_LATIN)
         if latin is None:
             continue
         font = latin.attrib.get("typeface")
@@ -344,7 +392,7 @@ def _extract_text_fonts(tx_body: ET.Element) -> list[dict[str, Any]]:
 
 def _extract_text_sizes(tx_body: ET.Element) -> list[dict[str, Any]]:
     counts: dict[float, int] = {}
-    for rpr in tx_body.findall(".//a:rPr", NS) + tx_body.findall(".//a:defRPr", NS):
+    for rpr in run_properties(tx_body):
         raw = rpr.attrib.get("sz")
         if not raw or not raw.isdigit():
             continue
@@ -1,11 +1,41 @@
 from __future__ import annotations
 
+import re
 import xml.etree.ElementTree as ET
+from typing import Iterator
 
 A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
 P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
 NS = {"a": A_NS, "p": P_NS}
 
+_SRGB_CLR = f"{{{A_NS}}}srgbClr"
+_SCHEME_CLR = f"{{{A_NS}}}schemeClr"
+_SYS_CLR = f"{{{A_NS}}}sysClr"
+_PRST_CLR = f"{{{A_NS}}}prstClr"
+_LATIN = f"{{{A_NS}}}latin"
+_RPR = f"{{{A_NS}}}rPr"
+_DEF_RPR = f"{{{A_NS}}}defRPr"
+_CLR_MAP_OVR = f"{{{P_NS}}}clrMapOvr"
+_HARDCODED_COLOR_TAGS = frozenset({_SRGB_CLR, _SYS_CLR})
+_COLOR_CONTAINER_TAGS = frozenset({f"{{{A_NS}}}solidFill", f"{{{A_NS}}}gs"})
+_COLOR_TAGS = frozenset({_SRGB_CLR, _SCHEME_CLR, _SYS_CLR, _PRST_CLR})
+_INLINE_FORMATTING_RANK = {
+    f"{{{A_NS}}}{tag}": rank
+    for rank, tag in enumerate(
+        (
+            "rPr",
+            "defRPr",
+            "lstStyle",
+            "buClr",
+            "buSz",
+            "buFont",
+            "buChar",
+            "buAutoNum",
+        )
+    )
+}
+_FONT_TARGET_PATHS = (f".//{{{A_NS}}}rPr", f".//{{{A_NS}}}defRPr")
+
 SCHEME_SYNONYMS = {
     "dark1": "dk1",
     "light1": "lt1",
@@ -14,13 +44,23 @@ SCHEME_SYNONYMS = {
 }
 
 
+def has_srgb_colors(xml_bytes: bytes) -> bool:
+    return b"srgbClr" in xml_bytes
+
+
+def color_mapping_pattern(mapping: dict[str, str]) -> re.Pattern[bytes]:
+    return re.compile(
+        b"|".join(re.escape(key.encode("utf-8")) for key in mapping), re.IGNORECASE
+    )
+
+
 def apply_color_mapping(root: ET.Element, mapping: dict[str, str]) -> int:
     normalized = normalize_mapping(mapping)
     replacements = 0
     for parent in root.iter():
         children = list(parent)
         for index, child in enumerate(children):
-            if child.tag != f"{{{A_NS}}}srgbClr":
+            if child.tag != _SRGB_CLR:
                 continue
             raw = child.attrib.get("val", "")
             if not raw:
@@ -29,7 +69,7 @@ def apply_color_mapping(root: ET.Element, mapping: dict[str, str]) -> int:
             if key not in normalized:
                 continue
             scheme_val = normalized[key]
-            scheme = ET.Element(f"{{{A_NS}}}schemeClr", {"val": scheme_val})
+            scheme = ET.Element(_SCHEME_CLR, {"val": scheme_val})
             scheme.extend(list(child))
             scheme.text = child.text
             scheme.tail = child.tail
@@ -40,69 +80,72 @@ def apply_color_mapping(root: ET.Element, mapping: dict[str, str]) -> int:
 
 
 def strip_hardcoded_colors(root: ET.Element) -> int:
-    removed = 0
-    parent_map = _parent_map(root)
-    for node in list(root.iter()):
-        if node.tag in {f"{{{A_NS}}}srgbClr", f"{{{A_NS}}}sysClr"}:
-            parent = parent_map.get(node)
-            if parent is not None:
-                parent.remove(node)
-                removed += 1
-
-    for node in root.findall(".//p:clrMapOvr", NS):
-        parent = parent_map.get(node)
-        if parent is not None:
+    targets = []
+    containers = []
+    stack = [(root, False)]
+    while stack:
+        parent, in_color = stack.pop()
+        for child in parent:
+            tag = child.tag
+            if tag in _HARDCODED_COLOR_TAGS:
+                targets.append((parent, child))
+                stack.append((child, True))
+                continue
+            if not in_color:
+                if tag == _CLR_MAP_OVR:
+                    targets.append((parent, child))
+                elif tag in _COLOR_CONTAINER_TAGS:
+                    containers.append((parent, child))
+            stack.append((child, in_color))
+
+    for parent, node in targets:
+        parent.remove(node)
+
+    for parent, node in containers:
+        if not _has_color_child(node):
             parent.remove(node)
-            removed += 1
 
-    for solid in root.findall(".//a:solidFill", NS):
-        if not _has_color_child(solid):
-            parent = parent_map.get(solid)
-            if parent is not None:
-                parent.remove(solid)
-
-    for gs in root.findall(".//a:gs", NS):
-        if not _has_color_child(gs):
-            parent = parent_map.get(gs)
-            if parent is not None:
-                parent.remove(gs)
-
-    return removed
+    return len(targets)
 
 
 def strip_inline_formatting(root: ET.Element) -> int:
-    removed = 0
-    parent_map = _parent_map(root)
-    for tag in [
-        f"{{{A_NS}}}rPr",
-        f"{{{A_NS}}}defRPr",
-        f"{{{A_NS}}}lstStyle",
-        f"{{{A_NS}}}buClr",
-        f"{{{A_NS}}}buSz",
-        f"{{{A_NS}}}buFont",
-        f"{{{A_NS}}}buChar",
-        f"{{{A_NS}}}buAutoNum",
-    ]:
-        for node in root.findall(f".//{tag}"):
-            parent = parent_map.get(node)
-            if parent is not None:
-                parent.remove(node)
-                removed += 1
-    return removed
+    targets = []
+    unranked = len(_INLINE_FORMATTING_RANK)
+    stack = [(root, unranked)]
+    while stack:
+        parent, limit = stack.pop()
+        for child in parent:
+            rank = _INLINE_FORMATTING_RANK.get(child.tag, unranked)
+            if rank < unranked and rank <= limit:
+                targets.append((parent, child))
+            stack.append((child, min(rank, limit)))
+    for parent, node in targets:
+        parent.remove(node)
+    return len(targets)
 
 
 def set_text_font_family(root: ET.Element, typeface: str) -> int:
     updated = 0
-    for tag in ["rPr", "defRPr"]:
-        for node in root.findall(f".//a:{tag}", NS):
-            latin = node.find("a:latin", NS)
+    for path in _FONT_TARGET_PATHS:
+        for node in root.findall(path):
+            latin = node.find(_LATIN)
             if latin is None:
-                latin = ET.SubElement(node, f"{{{A_NS}}}latin")
+                latin = ET.SubElement(node, _LATIN)
             latin.set("typeface", typeface)
             updated += 1
     return updated
 
 
+def run_properties(root: ET.Element) -> Iterator[ET.Element]:
+    def_rprs = []
+    for node in root.iter():
+        if node.tag == _RPR:
+            yield node
+        elif node.tag == _DEF_RPR:
+            def_rprs.append(node)
+    yield from def_rprs
+
+
 def normalize_mapping(mapping: dict[str, str]) -> dict[str, str]:
     normalized: dict[str, str] = {}
     for key, value in mapping.items():
@@ -113,17 +156,8 @@ def normalize_mapping(mapping: dict[str, str]) -> dict[str, str]:
     return normalized
 
 
-def _parent_map(root: ET.Element) -> dict[ET.Element, ET.Element]:
-    return {child: parent for parent in root.iter() for child in list(parent)}
-
-
 def _has_color_child(node: ET.Element) -> bool:
-    for child in list(node):
-        if child.tag in {
-            f"{{{A_NS}}}srgbClr",
-            f"{{{A_NS}}}schemeClr",
-            f"{{{A_NS}}}sysClr",
-            f"{{{A_NS}}}prstClr",
-        }:
+    for child in node:
+        if child.tag in _COLOR_TAGS:
             return True
     return False
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import io
 import posixpath
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
@@ -9,6 +10,7 @@ from typing import Iterable
 from .content_types import ensure_override, remove_override
 from .formatting import (
     apply_color_mapping,
+    has_srgb_colors,
     set_text_font_family,
     strip_hardcoded_colors,
     strip_inline_formatting,
@@ -18,12 +20,13 @@ from .package import OOXMLPackage
 from .rels import (
     Relationship,
     ensure_relationship,
-    parse_relationships,
+    read_relationships,
     rels_part_for,
     serialize_relationships,
 )
 from .slide_index import slide_parts_in_order
 from .typography import set_layout_text_styles, set_master_text_styles
+from .xmlutil import serialize_xml
 
 P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
 A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
@@ -31,6 +34,11 @@ R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 
 NS = {"p": P_NS, "a": A_NS, "r": R_NS}
 
+_R_ID = f"{{{R_NS}}}id"
+_R_ID_ATTRS = tuple(f"{{{R_NS}}}{attr}" for attr in ("embed", "link", "id"))
+_SLD_LAYOUT_ID_LST = f"{{{P_NS}}}sldLayoutIdLst"
+_SLD_LAYOUT_ID = f"{{{P_NS}}}sldLayoutId"
+
 SLIDE_LAYOUT_REL = (
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
 )
@@ -54,7 +62,8 @@ def make_layout_from_slide(
         raise ValueError("Slide number out of range")
 
     master_part = _master_part_by_index(pkg, master_index)
-    template_layout = _first_layout_for_master(pkg, master_part)
+    master = _index_master(pkg, master_part)
+    template_layout = _first_layout_for_master(pkg, master)
 
     slide_part = slide_parts[slide_number - 1]
     slide_root = ET.fromstring(pkg.read_part(slide_part))
@@ -78,19 +87,16 @@ def make_layout_from_slide(
     layout_root.set("name", name)
 
     new_layout_part = _next_layout_part(pkg)
-    pkg.write_part(
-        new_layout_part,
-        ET.tostring(layout_root, encoding="utf-8", xml_declaration=True),
-    )
+    _write_xml(pkg, new_layout_part, layout_root)
 
     layout_rels = _layout_relationships_from_slide(
         pkg, slide_part, master_part, new_layout_part
     )
     pkg.write_part(rels_part_for(new_layout_part), serialize_relationships(layout_rels))
 
-    master_rel_target = _rel_target(master_part, new_layout_part)
-    rel = ensure_relationship(pkg, master_part, SLIDE_LAYOUT_REL, master_rel_target)
-    _insert_layout_id(master_part, pkg, rel.id)
+    rel_id = _add_layout_relationship(master, new_layout_part)
+    _insert_layout_id(master, rel_id)
+    _write_master(pkg, master)
 
     ensure_override(pkg, f"/{new_layout_part}", SLIDE_LAYOUT_CONTENT_TYPE)
 
@@ -109,10 +115,13 @@ def assign_slides_to_layout(
 
 
 def apply_palette_to_part(pkg: OOXMLPackage, part: str, mapping: dict[str, str]) -> int:
-    root = ET.fromstring(pkg.read_part(part))
+    data = pkg.read_part(part)
+    if not mapping or not has_srgb_colors(data):
+        return 0
+    root = ET.fromstring(data)
     replacements = apply_color_mapping(root, mapping)
     if replacements:
-        pkg.write_part(part, ET.tostring(root, encoding="utf-8", xml_declaration=True))
+        _write_xml(pkg, part, root)
     return replacements
 
 
@@ -120,7 +129,7 @@ def strip_colors_from_part(pkg: OOXMLPackage, part: str) -> int:
     root = ET.fromstring(pkg.read_part(part))
     removed = strip_hardcoded_colors(root)
     if removed:
-        pkg.write_part(part, ET.tostring(root, encoding="utf-8", xml_declaration=True))
+        _write_xml(pkg, part, root)
     return removed
 
 
@@ -128,7 +137,7 @@ def strip_fonts_from_part(pkg: OOXMLPackage, part: str) -> int:
     root = ET.fromstring(pkg.read_part(part))
     removed = strip_inline_formatting(root)
     if removed:
-        pkg.write_part(part, ET.tostring(root, encoding="utf-8", xml_declaration=True))
+        _write_xml(pkg, part, root)
     return removed
 
 
@@ -136,10 +145,39 @@ def set_font_family_for_part(pkg: OOXMLPackage, part: str, font: str) -> int:
     root = ET.fromstring(pkg.read_part(part))
     updated = set_text_font_family(root, font)
     if updated:
-        pkg.write_part(part, ET.tostring(root, encoding="utf-8", xml_declaration=True))
+        _write_xml(pkg, part, root)
     return updated
 
 
+def edit_part_formatting(
+    pkg: OOXMLPackage,
+    part: str,
+    *,
+    palette: dict[str, str] | None = None,
+    strip_colors: bool = False,
+    font: str | None = None,
+    strip_fonts: bool = False,
+) -> int:
+    data = pkg.read_part(part)
+    if palette and not has_srgb_colors(data):
+        palette = None
+    if not (palette or strip_colors or font or strip_fonts):
+        return 0
+    root = ET.fromstring(data)
+    changes = 0
+    if palette:
+        changes += apply_color_mapping(root, palette)
+    if strip_colors:
+        changes += strip_hardcoded_colors(root)
+    if font:
+        changes += set_text_font_family(root, font)
+    if strip_fonts:
+        changes += strip_inline_formatting(root)
+    if changes:
+        _write_xml(pkg, part, root)
+    return changes
+
+
 def set_layout_background_image(
     pkg: OOXMLPackage, layout_part: str, image_path: str
 ) -> None:
@@ -165,9 +203,7 @@ def set_layout_background_image(
     stretch = ET.SubElement(blip_fill, f"{{{A_NS}}}stretch")
     ET.SubElement(stretch, f"{{{A_NS}}}fillRect")
 
-    pkg.write_part(
-        layout_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-    )
+    _write_xml(pkg, layout_part, root)
 
 
 def add_layout_image_shape(
@@ -211,9 +247,7 @@ def add_layout_image_shape(
     prst = ET.SubElement(sp_pr, f"{{{A_NS}}}prstGeom", {"prst": "rect"})
     ET.SubElement(prst, f"{{{A_NS}}}avLst")
 
-    pkg.write_part(
-        layout_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-    )
+    _write_xml(pkg, layout_part, root)
 
 
 def set_layout_text_styles_for_part(
@@ -229,9 +263,7 @@ def set_layout_text_styles_for_part(
         root, title_size_pt, title_bold, body_size_pt, body_bold
     )
     if updated:
-        pkg.write_part(
-            layout_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-        )
+        _write_xml(pkg, layout_part, root)
     return updated
 
 
@@ -248,9 +280,7 @@ def set_master_text_styles_for_part(
         root, title_size_pt, title_bold, body_size_pt, body_bold
     )
     if updated:
-        pkg.write_part(
-            master_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-        )
+        _write_xml(pkg, master_part, root)
     return updated
 
 
@@ -290,7 +320,7 @@ def _set_slide_layout(pkg: OOXMLPackage, slide_part: str, layout_part: str) -> N
     rels_part = rels_part_for(slide_part)
     if not pkg.has_part(rels_part):
         raise ValueError(f"Missing relationships for slide: {slide_part}")
-    relationships = parse_relationships(pkg.read_part(rels_part))
+    relationships = read_relationships(pkg, rels_part)
     updated = False
     target = _rel_target(slide_part, layout_part)
     for rel in relationships:
@@ -308,23 +338,11 @@ def _set_slide_layout(pkg: OOXMLPackage, slide_part: str, layout_part: str) -> N
 
 
 def _layout_parts(pkg: OOXMLPackage) -> list[str]:
-    return sorted(
-        [
-            p
-            for p in pkg.list_parts()
-            if p.startswith("ppt/slideLayouts/") and p.endswith(".xml")
-        ]
-    )
+    return [p for p in pkg.parts_under("ppt/slideLayouts/") if p.endswith(".xml")]
 
 
 def _master_part_by_index(pkg: OOXMLPackage, index: int) -> str:
-    masters = sorted(
-        [
-            p
-            for p in pkg.list_parts()
-            if p.startswith("ppt/slideMasters/") and p.endswith(".xml")
-        ]
-    )
+    masters = [p for p in pkg.parts_under("ppt/slideMasters/") if p.endswith(".xml")]
     if not masters:
         raise ValueError("No slide master parts found")
     if index < 1 or index > len(masters):
@@ -332,12 +350,10 @@ def _master_part_by_index(pkg: OOXMLPackage, index: int) -> str:
     return masters[index - 1]
 
 
-def _first_layout_for_master(pkg: OOXMLPackage, master_part: str) -> str:
-    rels_part = rels_part_for(master_part)
-    relationships = parse_relationships(pkg.read_part(rels_part))
-    for rel in relationships:
+def _first_layout_for_master(pkg: OOXMLPackage, master: _MasterRelsIndex) -> str:
+    for rel in master.rels:
         if rel.type == SLIDE_LAYOUT_REL:
-            return _resolve_target(posixpath.dirname(master_part), rel.target)
+            return master.resolved[rel.id]
     layouts = _layout_parts(pkg)
     if not layouts:
         raise ValueError("No slide layout parts found")
@@ -348,7 +364,7 @@ def _layout_relationships_from_slide(
     pkg: OOXMLPackage, slide_part: str, master_part: str, layout_part: str
 ) -> list[Relationship]:
     rels_part = rels_part_for(slide_part)
-    slide_rels = parse_relationships(pkg.read_part(rels_part))
+    slide_rels = read_relationships(pkg, rels_part)
     embed_ids = _slide_embed_ids(pkg.read_part(slide_part))
 
     layout_rels = [rel for rel in slide_rels if rel.id in embed_ids]
@@ -362,35 +378,44 @@ def _layout_relationships_from_slide(
 
 
 def _slide_embed_ids(xml_bytes: bytes) -> set[str]:
-    root = ET.fromstring(xml_bytes)
     ids = set()
-    for node in root.iter():
-        for attr in ("embed", "link", "id"):
-            rid = node.attrib.get(f"{{{R_NS}}}{attr}")
-            if rid:
-                ids.add(rid)
+    for _, node in ET.iterparse(io.BytesIO(xml_bytes)):
+        attrib = node.attrib
+        if attrib:
+            for attr in _R_ID_ATTRS:
+                rid = attrib.get(attr)
+                if rid:
+                    ids.add(rid)
+        node.clear()
     return ids
 
 
-def _insert_layout_id(master_part: str, pkg: OOXMLPackage, rel_id: str) -> None:
-    root = ET.fromstring(pkg.read_part(master_part))
-    layout_list = root.find("p:sldLayoutIdLst", NS)
+def _add_layout_relationship(master: _MasterRelsIndex, layout_part: str) -> str:
+    for rel in master.rels:
+        if rel.type == SLIDE_LAYOUT_REL and master.resolved[rel.id] == layout_part:
+            return rel.id
+    rel_id = _next_rid(master.rels)
+    target = _rel_target(master.master_part, layout_part)
+    master.rels.append(Relationship(id=rel_id, type=SLIDE_LAYOUT_REL, target=target))
+    master.resolved[rel_id] = layout_part
+    return rel_id
+
+
+def _insert_layout_id(master: _MasterRelsIndex, rel_id: str) -> None:
+    root = master.root
+    layout_list = root.find(_SLD_LAYOUT_ID_LST)
     if layout_list is None:
-        layout_list = ET.SubElement(root, f"{{{P_NS}}}sldLayoutIdLst")
+        layout_list = ET.SubElement(root, _SLD_LAYOUT_ID_LST)
 
     max_id = 0
-    for sld_layout_id in layout_list.findall("p:sldLayoutId", NS):
+    for sld_layout_id in layout_list.findall(_SLD_LAYOUT_ID):
         raw = sld_layout_id.attrib.get("id")
         if raw and raw.isdigit():
             max_id = max(max_id, int(raw))
 
     new_id = str(max_id + 1 if max_id else 256)
-    attrib = {"id": new_id, f"{{{R_NS}}}id": rel_id}
-    ET.SubElement(layout_list, f"{{{P_NS}}}sldLayoutId", attrib)
-
-    pkg.write_part(
-        master_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-    )
+    attrib = {"id": new_id, _R_ID: rel_id}
+    ET.SubElement(layout_list, _SLD_LAYOUT_ID, attrib)
 
 
 def _next_layout_part(pkg: OOXMLPackage) -> str:
@@ -405,6 +430,10 @@ def _next_layout_part(pkg: OOXMLPackage) -> str:
     return f"ppt/slideLayouts/slideLayout{next_index}.xml"
 
 
+def _write_xml(pkg: OOXMLPackage, part: str, root: ET.Element) -> None:
+    pkg.write_part(part, serialize_xml(root))
+
+
 def _rel_target(source_part: str, target_part: str) -> str:
     source_dir = posixpath.dirname(source_part)
     return posixpath.relpath(target_part, start=source_dir)
@@ -417,11 +446,12 @@ def _resolve_target(base_dir: str, target: str) -> str:
 
 
 def _next_rid(relationships: list[Relationship]) -> str:
-    existing = {rel.id for rel in relationships}
-    idx = 1
-    while f"rId{idx}" in existing:
-        idx += 1
-    return f"rId{idx}"
+    numbers = [
+        int(rel.id[3:])
+        for rel in relationships
+        if rel.id.startswith("rId") and rel.id[3:].isdigit()
+    ]
+    return f"rId{max(numbers, default=0) + 1}"
 
 
 def slide_size(pkg: OOXMLPackage) -> tuple[int, int]:
@@ -445,20 +475,62 @@ def _next_shape_id(sp_tree: ET.Element) -> int:
     return max_id + 1
 
 
-@dataclass
+@dataclass(slots=True)
 class PruneLayoutsResult:
     removed_layouts: list[str]
     unused_layouts: list[str]
     masters_updated: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReindexLayoutsResult:
     layout_mapping: dict[str, str]
     masters_updated: int
     slides_updated: int
 
 
+@dataclass(slots=True)
+class _MasterRelsIndex:
+    master_part: str
+    root: ET.Element
+    rels: list[Relationship]
+    resolved: dict[str, str]
+
+
+def _index_master(pkg: OOXMLPackage, master_part: str) -> _MasterRelsIndex:
+    rels_part = rels_part_for(master_part)
+    rels = read_relationships(pkg, rels_part) if pkg.has_part(rels_part) else []
+    master_dir = posixpath.dirname(master_part)
+    return _MasterRelsIndex(
+        master_part=master_part,
+        root=ET.fromstring(pkg.read_part(master_part)),
+        rels=rels,
+        resolved={rel.id: _resolve_target(master_dir, rel.target) for rel in rels},
+    )
+
+
+def _layout_rel_targets(
+    pkg: OOXMLPackage, master_part: str, layouts: set[str]
+) -> dict[str, str]:
+    rels_part = rels_part_for(master_part)
+    if not pkg.has_part(rels_part):
+        return {}
+    master_dir = posixpath.dirname(master_part)
+    targets = {}
+    for rel in read_relationships(pkg, rels_part):
+        if rel.type.endswith("/slideLayout"):
+            target = _resolve_target(master_dir, rel.target)
+            if target in layouts:
+                targets[rel.id] = target
+    return targets
+
+
+def _write_master(pkg: OOXMLPackage, master: _MasterRelsIndex) -> None:
+    rels_part = rels_part_for(master.master_part)
+    pkg.write_part(rels_part, serialize_relationships(master.rels))
+    _write_xml(pkg, master.master_part, master.root)
+
+
 def prune_unused_layouts(
     pkg: OOXMLPackage, *, keep_layouts: set[str] | None = None
 ) -> PruneLayoutsResult:
@@ -477,9 +549,24 @@ def prune_unused_layouts(
         if layout not in used_layouts and layout not in keep
     ]
 
+    unused_set = set(unused)
     masters_updated = 0
+    for master_part in _master_parts(pkg):
+        removed = _layout_rel_targets(pkg, master_part, unused_set)
+        if not removed:
+            continue
+
+        master = _index_master(pkg, master_part)
+        master.rels = [rel for rel in master.rels if rel.id not in removed]
+        layout_list = master.root.find(_SLD_LAYOUT_ID_LST)
+        if layout_list is not None:
+            for layout_id in layout_list.findall(_SLD_LAYOUT_ID):
+                if layout_id.attrib.get(_R_ID) in removed:
+                    layout_list.remove(layout_id)
+        _write_master(pkg, master)
+        masters_updated += len(set(removed.values()))
+
     for layout in unused:
-        masters_updated += _remove_layout_from_masters(pkg, layout)
         pkg.delete_part(layout)
         rels_part = rels_part_for(layout)
         if pkg.has_part(rels_part):
@@ -492,7 +579,8 @@ def prune_unused_layouts(
 
 
 def reindex_layouts(pkg: OOXMLPackage) -> ReindexLayoutsResult:
-    mapping = _build_layout_reindex_map(pkg)
+    masters = [_index_master(pkg, part) for part in _master_parts(pkg)]
+    mapping = _build_layout_reindex_map(pkg, masters)
     if not mapping:
         return ReindexLayoutsResult(
             layout_mapping={}, masters_updated=0, slides_updated=0
@@ -500,7 +588,7 @@ def reindex_layouts(pkg: OOXMLPackage) -> ReindexLayoutsResult:
 
     _rename_layout_parts(pkg, mapping)
     slides_updated = _update_slide_layout_relationships(pkg, mapping)
-    masters_updated = _reindex_master_layouts(pkg, mapping)
+    masters_updated = _reindex_master_layouts(pkg, masters, mapping)
 
     return ReindexLayoutsResult(
         layout_mapping=mapping,
@@ -509,14 +597,16 @@ def reindex_layouts(pkg: OOXMLPackage) -> ReindexLayoutsResult:
     )
 
 
-def _build_layout_reindex_map(pkg: OOXMLPackage) -> dict[str, str]:
+def _build_layout_reindex_map(
+    pkg: OOXMLPackage, masters: list[_MasterRelsIndex]
+) -> dict[str, str]:
     layout_parts = _layout_parts(pkg)
     if not layout_parts:
         return {}
 
     mapping: dict[str, str] = {}
-    for master_part in _master_parts(pkg):
-        order = _master_layout_order(pkg, master_part)
+    for master in masters:
+        order = _master_layout_order(master)
         if not order:
             continue
         for idx, layout_part in enumerate(order, start=1):
@@ -579,7 +669,7 @@ def _update_slide_layout_relationships(
         rels_part = rels_part_for(slide_part)
         if not pkg.has_part(rels_part):
             continue
-        rels = parse_relationships(pkg.read_part(rels_part))
+        rels = read_relationships(pkg, rels_part)
         changed = False
         for rel in rels:
             if not rel.type.endswith("/slideLayout"):
@@ -594,20 +684,18 @@ def _update_slide_layout_relationships(
     return updated
 
 
-def _reindex_master_layouts(pkg: OOXMLPackage, mapping: dict[str, str]) -> int:
+def _reindex_master_layouts(
+    pkg: OOXMLPackage, masters: list[_MasterRelsIndex], mapping: dict[str, str]
+) -> int:
     updated = 0
-    for master_part in _master_parts(pkg):
-        order = _master_layout_order(pkg, master_part)
+    for master in masters:
+        order = _master_layout_order(master)
         if not order:
             continue
 
-        rels_part = rels_part_for(master_part)
-        rels = (
-            parse_relationships(pkg.read_part(rels_part))
-            if pkg.has_part(rels_part)
-            else []
-        )
-        non_layout = [rel for rel in rels if not rel.type.endswith("/slideLayout")]
+        non_layout = [
+            rel for rel in master.rels if not rel.type.endswith("/slideLayout")
+        ]
         used_ids = {rel.id for rel in non_layout}
 
         new_layout_rels: list[Relationship] = []
@@ -619,47 +707,31 @@ def _reindex_master_layouts(pkg: OOXMLPackage, mapping: dict[str, str]) -> int:
             rel_id = f"rId{next_idx}"
             used_ids.add(rel_id)
             next_idx += 1
-            target = _rel_target(master_part, new_part)
+            target = _rel_target(master.master_part, new_part)
             new_layout_rels.append(
                 Relationship(id=rel_id, type=SLIDE_LAYOUT_REL, target=target)
             )
 
-        new_rels = non_layout + new_layout_rels
-        pkg.write_part(rels_part, serialize_relationships(new_rels))
-
-        root = ET.fromstring(pkg.read_part(master_part))
-        layout_list = root.find("p:sldLayoutIdLst", NS)
+        master.rels = non_layout + new_layout_rels
+        layout_list = master.root.find(_SLD_LAYOUT_ID_LST)
         if layout_list is not None:
             for node, layout_rel in zip(
-                layout_list.findall("p:sldLayoutId", NS), new_layout_rels
+                layout_list.findall(_SLD_LAYOUT_ID), new_layout_rels
             ):
-                node.set(f"{{{R_NS}}}id", layout_rel.id)
-        pkg.write_part(
-            master_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-        )
+                node.set(_R_ID, layout_rel.id)
+        _write_master(pkg, master)
         updated += 1
     return updated
 
 
-def _master_layout_order(pkg: OOXMLPackage, master_part: str) -> list[str]:
-    rels_part = rels_part_for(master_part)
-    if not pkg.has_part(rels_part):
-        return []
-    rels = parse_relationships(pkg.read_part(rels_part))
-    rel_map = {rel.id: rel for rel in rels}
-
-    root = ET.fromstring(pkg.read_part(master_part))
-    layout_list = root.find("p:sldLayoutIdLst", NS)
+def _master_layout_order(master: _MasterRelsIndex) -> list[str]:
+    layout_list = master.root.find(_SLD_LAYOUT_ID_LST)
     if layout_list is None:
         return []
 
     order: list[str] = []
-    for node in layout_list.findall("p:sldLayoutId", NS):
-        rid = node.attrib.get(f"{{{R_NS}}}id")
-        rel = rel_map.get(rid)
-        if rel is None:
-            continue
-        target = _resolve_target(posixpath.dirname(master_part), rel.target)
+    for node in layout_list.findall(_SLD_LAYOUT_ID):
+        target = master.resolved.get(node.attrib.get(_R_ID, ""))
         if target:
             order.append(target)
     return order
@@ -669,7 +741,7 @@ def _slide_layout_part(pkg: OOXMLPackage, slide_part: str) -> str | None:
     rels_part = rels_part_for(slide_part)
     if not pkg.has_part(rels_part):
         return None
-    relationships = parse_relationships(pkg.read_part(rels_part))
+    relationships = read_relationships(pkg, rels_part)
     for rel in relationships:
         if rel.type.endswith("/slideLayout"):
             return _resolve_target(posixpath.dirname(slide_part), rel.target)
@@ -677,46 +749,4 @@ def _slide_layout_part(pkg: OOXMLPackage, slide_part: str) -> str | None:
 
 
 def _master_parts(pkg: OOXMLPackage) -> list[str]:
-    return sorted(
-        [
-            p
-            for p in pkg.list_parts()
-            if p.startswith("ppt/slideMasters/") and p.endswith(".xml")
-        ]
-    )
-
-
-def _remove_layout_from_masters(pkg: OOXMLPackage, layout_part: str) -> int:
-    updated = 0
-    for master_part in _master_parts(pkg):
-        rels_part = rels_part_for(master_part)
-        if not pkg.has_part(rels_part):
-            continue
-        relationships = parse_relationships(pkg.read_part(rels_part))
-        keep_rels: list[Relationship] = []
-        removed_ids: set[str] = set()
-        for rel in relationships:
-            if rel.type.endswith("/slideLayout"):
-                target = _resolve_target(posixpath.dirname(master_part), rel.target)
-                if target == layout_part:
-                    removed_ids.add(rel.id)
-                    continue
-            keep_rels.append(rel)
-
-        if not removed_ids:
-            continue
-
-        pkg.write_part(rels_part, serialize_relationships(keep_rels))
-
-        root = ET.fromstring(pkg.read_part(master_part))
-        layout_list = root.find("p:sldLayoutIdLst", NS)
-        if layout_list is not None:
-            for layout_id in list(layout_list.findall("p:sldLayoutId", NS)):
-                rid = layout_id.attrib.get(f"{{{R_NS}}}id")
-                if rid in removed_ids:
-                    layout_list.remove(layout_id)
-        pkg.write_part(
-            master_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-        )
-        updated += 1
-    return updated
+    return [p for p in pkg.parts_under("ppt/slideMasters/") if p.endswith(".xml")]
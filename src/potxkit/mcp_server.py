@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import inspect
 import json
-from dataclasses import asdict
-from typing import Any
+from typing import Any, Callable
 
 from fastmcp import FastMCP
 
@@ -11,19 +11,16 @@ from .dump_tree import DumpTreeOptions, summarize_tree
 from .dump_tree import dump_tree as _dump_tree
 from .layout_ops import (
     add_layout_image_shape,
-    apply_palette_to_part,
     assign_slides_to_layout,
+    edit_part_formatting,
     make_layout_from_slide,
     prune_unused_layouts,
     resolve_layout_part,
     resolve_master_part,
-    set_font_family_for_part,
     set_layout_background_image,
     set_layout_text_styles_for_part,
     set_master_text_styles_for_part,
     slide_size,
-    strip_colors_from_part,
-    strip_fonts_from_part,
 )
 from .layout_ops import (
     reindex_layouts as _reindex_layouts,
@@ -31,8 +28,8 @@ from .layout_ops import (
 from .normalize import normalize_slide_colors, parse_slide_numbers
 from .package import OOXMLPackage
 from .sanitize import sanitize_slides
-from .slide_index import slide_parts_in_order
-from .storage import read_bytes, write_bytes
+from .slide_index import select_slide_parts
+from .storage import read_bytes, save_package
 from .template import PotxTemplate
 
 mcp = FastMCP("potxkit")
@@ -53,11 +50,6 @@ def _load_pkg(path: str) -> OOXMLPackage:
     return OOXMLPackage(read_bytes(path))
 
 
-def _save_pkg(pkg: OOXMLPackage, output: str) -> str:
-    write_bytes(output, pkg.save_bytes())
-    return output
-
-
 @mcp.tool()
 def info(path: str) -> dict[str, Any]:
     """Return theme colors, fonts, and validation status for a .pptx/.potx."""
@@ -158,10 +150,9 @@ def normalize(
 ) -> dict[str, Any]:
     """Replace hard-coded colors with theme scheme colors using a mapping."""
     pkg = _load_pkg(input_path)
-    slide_numbers = parse_slide_numbers(slides) if slides else None
-    result = normalize_slide_colors(pkg, mapping, slide_numbers)
-    _save_pkg(pkg, output)
-    return asdict(result)
+    result = _do_normalize(pkg, mapping, slides)
+    save_package(pkg, output)
+    return result
 
 
 @mcp.tool()
@@ -172,22 +163,7 @@ def set_colors(
 ) -> str:
     """Set theme color slots (dk1, lt1, accent1, etc.)."""
     tpl = PotxTemplate.open(input_path) if input_path else PotxTemplate.new()
-    theme_colors = tpl.theme.colors
-    for key, value in colors.items():
-        if key in {"dark1", "dk1"}:
-            theme_colors.set_dark1(value)
-        elif key in {"light1", "lt1"}:
-            theme_colors.set_light1(value)
-        elif key in {"dark2", "dk2"}:
-            theme_colors.set_dark2(value)
-        elif key in {"light2", "lt2"}:
-            theme_colors.set_light2(value)
-        elif key.startswith("accent") and key[6:].isdigit():
-            theme_colors.set_accent(int(key[6:]), value)
-        elif key == "hlink":
-            theme_colors.set_hyperlink(value)
-        elif key == "folHlink":
-            theme_colors.set_followed_hyperlink(value)
+    _do_set_colors(tpl, colors)
     tpl.save(output)
     return output
 
@@ -201,11 +177,7 @@ def set_fonts(
 ) -> str:
     """Set major/minor theme fonts."""
     tpl = PotxTemplate.open(input_path) if input_path else PotxTemplate.new()
-    fonts = tpl.theme.fonts
-    if major:
-        fonts.set_major(major)
-    if minor:
-        fonts.set_minor(minor)
+    _do_set_fonts(tpl, major, minor)
     tpl.save(output)
     return output
 
@@ -220,12 +192,7 @@ def set_theme_names(
 ) -> str:
     """Set theme, color scheme, and font scheme names for PowerPoint UI."""
     tpl = PotxTemplate.open(input_path) if input_path else PotxTemplate.new()
-    if theme:
-        tpl.theme.set_name(theme)
-    if colors:
-        tpl.theme.set_color_scheme_name(colors)
-    if fonts:
-        tpl.theme.set_font_scheme_name(fonts)
+    _do_set_theme_names(tpl, theme, colors, fonts)
     tpl.save(output)
     return output
 
@@ -241,12 +208,9 @@ def make_layout(
 ) -> dict[str, Any]:
     """Create a slide layout from a slide and optionally reassign slides to it."""
     pkg = _load_pkg(input_path)
-    layout_part = make_layout_from_slide(pkg, from_slide, name, master_index)
-    if assign_slides:
-        slides = parse_slide_numbers(assign_slides)
-        assign_slides_to_layout(pkg, slides, layout_part)
-    _save_pkg(pkg, output)
-    return {"output": output, "layout_part": layout_part}
+    result = _do_make_layout(pkg, from_slide, name, master_index, assign_slides)
+    save_package(pkg, output)
+    return {"output": output, **result}
 
 
 @mcp.tool()
@@ -261,16 +225,8 @@ def set_layout(
 ) -> str:
     """Update a layout's palette or fonts (or strip overrides)."""
     pkg = _load_pkg(input_path)
-    layout_part = resolve_layout_part(pkg, layout)
-    if palette:
-        apply_palette_to_part(pkg, layout_part, palette)
-    if palette_none:
-        strip_colors_from_part(pkg, layout_part)
-    if font:
-        set_font_family_for_part(pkg, layout_part, font)
-    if fonts_none:
-        strip_fonts_from_part(pkg, layout_part)
-    _save_pkg(pkg, output)
+    _do_set_layout(pkg, layout, palette, palette_none, font, fonts_none)
+    save_package(pkg, output)
     return output
 
 
@@ -286,16 +242,8 @@ def set_master(
 ) -> str:
     """Update a slide master palette or fonts (or strip overrides)."""
     pkg = _load_pkg(input_path)
-    master_part = resolve_master_part(pkg, master)
-    if palette:
-        apply_palette_to_part(pkg, master_part, palette)
-    if palette_none:
-        strip_colors_from_part(pkg, master_part)
-    if font:
-        set_font_family_for_part(pkg, master_part, font)
-    if fonts_none:
-        strip_fonts_from_part(pkg, master_part)
-    _save_pkg(pkg, output)
+    _do_set_master(pkg, master, palette, palette_none, font, fonts_none)
+    save_package(pkg, output)
     return output
 
 
@@ -312,28 +260,8 @@ def set_slide(
 ) -> str:
     """Update slide-level palette/fonts and optionally reassign layouts."""
     pkg = _load_pkg(input_path)
-    slide_numbers = parse_slide_numbers(slides)
-    parts = slide_parts_in_order(pkg)
-    slide_parts = []
-    for num in sorted(slide_numbers):
-        if num < 1 or num > len(parts):
-            raise ValueError("Slide number out of range")
-        slide_parts.append(parts[num - 1])
-
-    for slide_part in slide_parts:
-        if palette:
-            apply_palette_to_part(pkg, slide_part, palette)
-        if palette_none:
-            strip_colors_from_part(pkg, slide_part)
-        if font:
-            set_font_family_for_part(pkg, slide_part, font)
-        if fonts_none:
-            strip_fonts_from_part(pkg, slide_part)
-    if layout:
-        layout_part = resolve_layout_part(pkg, layout)
-        assign_slides_to_layout(pkg, slide_numbers, layout_part)
-
-    _save_pkg(pkg, output)
+    _do_set_slide(pkg, slides, layout, palette, palette_none, font, fonts_none)
+    save_package(pkg, output)
     return output
 
 
@@ -350,17 +278,10 @@ def set_text_styles(
 ) -> str:
     """Set title/body text sizes and bold styles on layouts or masters."""
     pkg = _load_pkg(input_path)
-    if layout:
-        layout_part = resolve_layout_part(pkg, layout)
-        set_layout_text_styles_for_part(
-            pkg, layout_part, title_size, title_bold, body_size, body_bold
-        )
-    if master:
-        master_part = resolve_master_part(pkg, master)
-        set_master_text_styles_for_part(
-            pkg, master_part, title_size, title_bold, body_size, body_bold
-        )
-    _save_pkg(pkg, output)
+    _do_set_text_styles(
+        pkg, layout, master, title_size, body_size, title_bold, body_bold
+    )
+    save_package(pkg, output)
     return output
 
 
@@ -368,9 +289,8 @@ def set_text_styles(
 def set_layout_bg(input_path: str, output: str, layout: str, image: str) -> str:
     """Set a layout background image."""
     pkg = _load_pkg(input_path)
-    layout_part = resolve_layout_part(pkg, layout)
-    set_layout_background_image(pkg, layout_part, image)
-    _save_pkg(pkg, output)
+    _do_set_layout_bg(pkg, layout, image)
+    save_package(pkg, output)
     return output
 
 
@@ -389,6 +309,290 @@ def set_layout_image(
 ) -> str:
     """Add an image layer to a layout (x/y/w/h in inches unless units=emu)."""
     pkg = _load_pkg(input_path)
+    _do_set_layout_image(pkg, layout, image, x, y, w, h, units, name)
+    save_package(pkg, output)
+    return output
+
+
+@mcp.tool()
+def auto_layout(
+    input_path: str,
+    output: str,
+    group_by: str = "p,l",
+    prefix: str = "Auto Layout",
+    master_index: int = 1,
+    assign: bool = True,
+    strip_colors: bool = False,
+    strip_fonts: bool = False,
+    palette: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Auto-generate layouts by grouping slides and optionally strip overrides."""
+    pkg = _load_pkg(input_path)
+    result = _do_auto_layout(
+        pkg,
+        group_by,
+        prefix,
+        master_index,
+        assign,
+        strip_colors,
+        strip_fonts,
+        palette,
+    )
+    save_package(pkg, output)
+    return {"output": output, **result}
+
+
+@mcp.tool()
+def prune_layouts(input_path: str, output: str) -> dict[str, Any]:
+    """Remove unused slide layouts and update master references."""
+    pkg = _load_pkg(input_path)
+    result = _do_prune_layouts(pkg)
+    save_package(pkg, output)
+    return {"output": output, **result}
+
+
+@mcp.tool()
+def reindex_layouts(input_path: str, output: str) -> dict[str, Any]:
+    """Renumber layouts and update slide/master references."""
+    pkg = _load_pkg(input_path)
+    result = _do_reindex_layouts(pkg)
+    save_package(pkg, output)
+    return {"output": output, **result}
+
+
+@mcp.tool()
+def sanitize(input_path: str, output: str, slides: str | None = None) -> dict[str, Any]:
+    """Insert missing clrMapOvr, lstStyle, and bg/noFill to avoid repair prompts."""
+    pkg = _load_pkg(input_path)
+    result = _do_sanitize(pkg, slides)
+    save_package(pkg, output)
+    return result
+
+
+@mcp.tool()
+def batch(
+    input_path: str | None, output: str, ops: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Apply ops like [{"tool": "sanitize", "args": {...}}] and save once."""
+    steps = []
+    for index, op in enumerate(ops):
+        name = op.get("tool")
+        args = op.get("args") or {}
+        message = _check_batch_op(name, args)
+        if message is not None:
+            return _batch_error(index, name, message)
+        steps.append((name, args))
+
+    uses_theme = any(name in _BATCH_THEME_OPS for name, _ in steps)
+    if uses_theme or input_path is None:
+        tpl = PotxTemplate.open(input_path) if input_path else PotxTemplate.new()
+        pkg = tpl.package
+    else:
+        pkg = _load_pkg(input_path)
+
+    results = []
+    for index, (name, args) in enumerate(steps):
+        try:
+            if name in _BATCH_THEME_OPS:
+                _BATCH_THEME_OPS[name](tpl, **args)
+                results.append({"tool": name})
+            else:
+                result = _BATCH_OPS[name](pkg, **args)
+                results.append({"tool": name, **(result or {})})
+        except Exception as exc:
+            return _batch_error(index, name, f"{type(exc).__name__}: {exc}")
+
+    if uses_theme:
+        tpl.save(output)
+    else:
+        save_package(pkg, output)
+    return {"output": output, "results": results}
+
+
+def _check_batch_op(name: Any, args: Any) -> str | None:
+    func = _BATCH_OPS.get(name) or _BATCH_THEME_OPS.get(name)
+    if func is None:
+        return f"Unsupported batch tool: {name}"
+    if not isinstance(args, dict):
+        return "args must be an object"
+    try:
+        inspect.signature(func).bind(None, **args)
+    except TypeError as exc:
+        return f"Invalid args for {name}: {exc}"
+    return None
+
+
+def _batch_error(index: int, name: Any, message: str) -> dict[str, Any]:
+    return {
+        "output": None,
+        "results": [],
+        "error": {"index": index, "tool": name, "message": message},
+    }
+
+
+def _do_normalize(
+    pkg: OOXMLPackage, mapping: dict[str, str], slides: str | None = None
+) -> dict[str, Any]:
+    slide_numbers = parse_slide_numbers(slides) if slides else None
+    return normalize_slide_colors(pkg, mapping, slide_numbers).as_dict()
+
+
+def _do_set_colors(tpl: PotxTemplate, colors: dict[str, str]) -> None:
+    theme_colors = tpl.theme.colors
+    for key, value in colors.items():
+        if key in {"dark1", "dk1"}:
+            theme_colors.set_dark1(value)
+        elif key in {"light1", "lt1"}:
+            theme_colors.set_light1(value)
+        elif key in {"dark2", "dk2"}:
+            theme_colors.set_dark2(value)
+        elif key in {"light2", "lt2"}:
+            theme_colors.set_light2(value)
+        elif key.startswith("accent") and key[6:].isdigit():
+            theme_colors.set_accent(int(key[6:]), value)
+        elif key == "hlink":
+            theme_colors.set_hyperlink(value)
+        elif key == "folHlink":
+            theme_colors.set_followed_hyperlink(value)
+
+
+def _do_set_fonts(
+    tpl: PotxTemplate, major: str | None = None, minor: str | None = None
+) -> None:
+    fonts = tpl.theme.fonts
+    if major:
+        fonts.set_major(major)
+    if minor:
+        fonts.set_minor(minor)
+
+
+def _do_set_theme_names(
+    tpl: PotxTemplate,
+    theme: str | None = None,
+    colors: str | None = None,
+    fonts: str | None = None,
+) -> None:
+    if theme:
+        tpl.theme.set_name(theme)
+    if colors:
+        tpl.theme.set_color_scheme_name(colors)
+    if fonts:
+        tpl.theme.set_font_scheme_name(fonts)
+
+
+def _do_make_layout(
+    pkg: OOXMLPackage,
+    from_slide: int,
+    name: str,
+    master_index: int = 1,
+    assign_slides: str | None = None,
+) -> dict[str, Any]:
+    layout_part = make_layout_from_slide(pkg, from_slide, name, master_index)
+    if assign_slides:
+        slides = parse_slide_numbers(assign_slides)
+        assign_slides_to_layout(pkg, slides, layout_part)
+    return {"layout_part": layout_part}
+
+
+def _do_set_layout(
+    pkg: OOXMLPackage,
+    layout: str,
+    palette: dict[str, str] | None = None,
+    palette_none: bool = False,
+    font: str | None = None,
+    fonts_none: bool = False,
+) -> None:
+    layout_part = resolve_layout_part(pkg, layout)
+    edit_part_formatting(
+        pkg,
+        layout_part,
+        palette=palette,
+        strip_colors=palette_none,
+        font=font,
+        strip_fonts=fonts_none,
+    )
+
+
+def _do_set_master(
+    pkg: OOXMLPackage,
+    master: str = "1",
+    palette: dict[str, str] | None = None,
+    palette_none: bool = False,
+    font: str | None = None,
+    fonts_none: bool = False,
+) -> None:
+    master_part = resolve_master_part(pkg, master)
+    edit_part_formatting(
+        pkg,
+        master_part,
+        palette=palette,
+        strip_colors=palette_none,
+        font=font,
+        strip_fonts=fonts_none,
+    )
+
+
+def _do_set_slide(
+    pkg: OOXMLPackage,
+    slides: str,
+    layout: str | None = None,
+    palette: dict[str, str] | None = None,
+    palette_none: bool = False,
+    font: str | None = None,
+    fonts_none: bool = False,
+) -> None:
+    slide_numbers = parse_slide_numbers(slides)
+    for slide_part in select_slide_parts(pkg, slide_numbers):
+        edit_part_formatting(
+            pkg,
+            slide_part,
+            palette=palette,
+            strip_colors=palette_none,
+            font=font,
+            strip_fonts=fonts_none,
+        )
+    if layout:
+        layout_part = resolve_layout_part(pkg, layout)
+        assign_slides_to_layout(pkg, slide_numbers, layout_part)
+
+
+def _do_set_text_styles(
+    pkg: OOXMLPackage,
+    layout: str | None = None,
+    master: str | None = None,
+    title_size: float | None = None,
+    body_size: float | None = None,
+    title_bold: bool | None = None,
+    body_bold: bool | None = None,
+) -> None:
+    if layout:
+        layout_part = resolve_layout_part(pkg, layout)
+        set_layout_text_styles_for_part(
+            pkg, layout_part, title_size, title_bold, body_size, body_bold
+        )
+    if master:
+        master_part = resolve_master_part(pkg, master)
+        set_master_text_styles_for_part(
+            pkg, master_part, title_size, title_bold, body_size, body_bold
+        )
+
+
+def _do_set_layout_bg(pkg: OOXMLPackage, layout: str, image: str) -> None:
+    layout_part = resolve_layout_part(pkg, layout)
+    set_layout_background_image(pkg, layout_part, image)
+
+
+def _do_set_layout_image(
+    pkg: OOXMLPackage,
+    layout: str,
+    image: str,
+    x: float | None = None,
+    y: float | None = None,
+    w: float | None = None,
+    h: float | None = None,
+    units: str = "in",
+    name: str | None = None,
+) -> None:
     layout_part = resolve_layout_part(pkg, layout)
     cx, cy = slide_size(pkg)
     if units == "emu":
@@ -403,14 +607,10 @@ def set_layout_image(
         w_emu = int((w if w is not None else (cx / factor)) * factor)
         h_emu = int((h if h is not None else (cy / factor)) * factor)
     add_layout_image_shape(pkg, layout_part, image, x_emu, y_emu, w_emu, h_emu, name)
-    _save_pkg(pkg, output)
-    return output
 
 
-@mcp.tool()
-def auto_layout(
-    input_path: str,
-    output: str,
+def _do_auto_layout(
+    pkg: OOXMLPackage,
     group_by: str = "p,l",
     prefix: str = "Auto Layout",
     master_index: int = 1,
@@ -419,8 +619,6 @@ def auto_layout(
     strip_fonts: bool = False,
     palette: dict[str, str] | None = None,
 ) -> dict[str, Any]:
-    """Auto-generate layouts by grouping slides and optionally strip overrides."""
-    pkg = _load_pkg(input_path)
     from .auto_layout import auto_layout as _auto
 
     result = _auto(
@@ -433,36 +631,44 @@ def auto_layout(
         strip_fonts=strip_fonts,
         palette=palette,
     )
-    _save_pkg(pkg, output)
-    return {"output": output, "layouts_created": len(result.created_layouts)}
+    return {"layouts_created": len(result.created_layouts)}
 
 
-@mcp.tool()
-def prune_layouts(input_path: str, output: str) -> dict[str, Any]:
-    """Remove unused slide layouts and update master references."""
-    pkg = _load_pkg(input_path)
+def _do_prune_layouts(pkg: OOXMLPackage) -> dict[str, Any]:
     result = prune_unused_layouts(pkg)
-    _save_pkg(pkg, output)
-    return {"output": output, "removed": len(result.removed_layouts)}
+    return {"removed": len(result.removed_layouts)}
 
 
-@mcp.tool()
-def reindex_layouts(input_path: str, output: str) -> dict[str, Any]:
-    """Renumber layouts and update slide/master references."""
-    pkg = _load_pkg(input_path)
+def _do_reindex_layouts(pkg: OOXMLPackage) -> dict[str, Any]:
     result = _reindex_layouts(pkg)
-    _save_pkg(pkg, output)
-    return {"output": output, "layout_mapping": result.layout_mapping}
+    return {"layout_mapping": result.layout_mapping}
 
 
-@mcp.tool()
-def sanitize(input_path: str, output: str, slides: str | None = None) -> dict[str, Any]:
-    """Insert missing clrMapOvr, lstStyle, and bg/noFill to avoid repair prompts."""
-    pkg = _load_pkg(input_path)
+def _do_sanitize(pkg: OOXMLPackage, slides: str | None = None) -> dict[str, Any]:
     slide_numbers = parse_slide_numbers(slides) if slides else None
-    result = sanitize_slides(pkg, slide_numbers)
-    _save_pkg(pkg, output)
-    return asdict(result)
+    return sanitize_slides(pkg, slide_numbers).as_dict()
+
+
+_BATCH_OPS: dict[str, Callable[..., dict[str, Any] | None]] = {
+    "normalize": _do_normalize,
+    "make_layout": _do_make_layout,
+    "set_layout": _do_set_layout,
+    "set_master": _do_set_master,
+    "set_slide": _do_set_slide,
+    "set_text_styles": _do_set_text_styles,
+    "set_layout_bg": _do_set_layout_bg,
+    "set_layout_image": _do_set_layout_image,
+    "auto_layout": _do_auto_layout,
+    "prune_layouts": _do_prune_layouts,
+    "reindex_layouts": _do_reindex_layouts,
+    "sanitize": _do_sanitize,
+}
+
+_BATCH_THEME_OPS: dict[str, Callable[..., None]] = {
+    "set_colors": _do_set_colors,
+    "set_fonts": _do_set_fonts,
+    "set_theme_names": _do_set_theme_names,
+}
 
 
 def main() -> None:
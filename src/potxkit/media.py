@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 from .content_types import ensure_default
@@ -13,6 +14,10 @@ IMAGE_TYPES = {
     "bmp": "image/bmp",
 }
 
+_MEDIA_RE = {
+    ext: re.compile(rf"ppt/media/image(\d+)\.{re.escape(ext)}") for ext in IMAGE_TYPES
+}
+
 
 def add_image_part(pkg: OOXMLPackage, image_path: str) -> str:
     path = Path(image_path)
@@ -29,14 +34,11 @@ def add_image_part(pkg: OOXMLPackage, image_path: str) -> str:
 
 
 def _next_media_part(pkg: OOXMLPackage, ext: str) -> str:
+    pattern = _MEDIA_RE[ext]
     numbers = []
-    for part in pkg.list_parts():
-        if not part.startswith("ppt/media/"):
-            continue
-        name = Path(part).name
-        if name.startswith("image") and name.endswith(f".{ext}"):
-            raw = name.removeprefix("image").removesuffix(f".{ext}")
-            if raw.isdigit():
-                numbers.append(int(raw))
+    for part in pkg.parts_under("ppt/media/"):
+        match = pattern.fullmatch(part)
+        if match:
+            numbers.append(int(match.group(1)))
     next_index = max(numbers) + 1 if numbers else 1
     return f"ppt/media/image{next_index}.{ext}"
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
+from typing import Any
 
-from .formatting import apply_color_mapping, normalize_mapping
+from .formatting import (
+    apply_color_mapping,
+    color_mapping_pattern,
+    has_srgb_colors,
+    normalize_mapping,
+)
 from .package import OOXMLPackage
 from .slide_index import slide_parts_in_order
+from .xmlutil import serialize_xml
 
 SCHEME_SYNONYMS = {
     "dark1": "dk1",
@@ -15,13 +22,21 @@ SCHEME_SYNONYMS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizeResult:
     slides_total: int
     slides_touched: int
     replacements: int
     per_slide: dict[int, int]
 
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "slides_total": self.slides_total,
+            "slides_touched": self.slides_touched,
+            "replacements": self.replacements,
+            "per_slide": self.per_slide,
+        }
+
 
 def normalize_slide_colors(
     pkg: OOXMLPackage,
@@ -30,6 +45,7 @@ def normalize_slide_colors(
 ) -> NormalizeResult:
     slide_parts = slide_parts_in_order(pkg)
     normalized_mapping = normalize_mapping(mapping)
+    pattern = color_mapping_pattern(normalized_mapping)
 
     per_slide: dict[int, int] = {}
     total_replacements = 0
@@ -38,12 +54,17 @@ def normalize_slide_colors(
     for idx, slide_part in enumerate(slide_parts, start=1):
         if slide_numbers and idx not in slide_numbers:
             continue
-        root = ET.fromstring(pkg.read_part(slide_part))
+        data = pkg.read_part(slide_part)
+        if (
+            not normalized_mapping
+            or not has_srgb_colors(data)
+            or not pattern.search(data)
+        ):
+            continue
+        root = ET.fromstring(data)
         replacements = apply_color_mapping(root, normalized_mapping)
         if replacements:
-            pkg.write_part(
-                slide_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-            )
+            pkg.write_part(slide_part, serialize_xml(root))
             total_replacements += replacements
             per_slide[idx] = replacements
             touched += 1
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 import io
+import struct
+import sys
 import zipfile
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, BinaryIO, Callable, Iterable
 
+STORED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".emf", ".wmf")
+MIN_DEFLATE_SIZE = 100
 
-@dataclass(frozen=True)
+SLIDE_INDEX_PARTS = ("ppt/presentation.xml", "ppt/_rels/presentation.xml.rels")
+
+_LOCAL_HEADER_SIZE = 30
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_RAW_COPY_VERSIONS = ((3, 11), (3, 14))
+_ZIP_WRITER_STATE = ("fp", "filelist", "NameToInfo", "start_dir")
+
+
+@dataclass(frozen=True, slots=True)
 class PackagePart:
     name: str
     data: bytes
@@ -15,58 +29,189 @@ class PackagePart:
 class OOXMLPackage:
     def __init__(self, data: bytes) -> None:
         self._parts: dict[str, bytes] = {}
+        self._infos: dict[str, zipfile.ZipInfo] = {}
         self._order: list[str] = []
+        self._by_prefix: dict[str, list[str]] = {}
+        self._slide_parts: list[str] | None = None
+        self._part_cache: dict[str, dict[str, Any]] = {}
         self._load(data)
 
     def _load(self, data: bytes) -> None:
-        with zipfile.ZipFile(io.BytesIO(data), "r") as zin:
-            for info in zin.infolist():
+        self._source = memoryview(data)
+        self._zip = zipfile.ZipFile(io.BytesIO(data), "r")
+        for info in self._zip.infolist():
+            if info.filename not in self._infos:
                 self._order.append(info.filename)
-                self._parts[info.filename] = zin.read(info.filename)
+                self._index_name(info.filename)
+            self._infos[info.filename] = info
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "OOXMLPackage":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def list_parts(self) -> list[str]:
-        return list(self._parts.keys())
+        return list(self._order)
+
+    def parts_under(self, prefix: str) -> list[str]:
+        return sorted(
+            name
+            for directory, names in self._by_prefix.items()
+            if directory.startswith(prefix) or prefix.startswith(directory)
+            for name in names
+            if name.startswith(prefix)
+        )
 
     def has_part(self, name: str) -> bool:
-        return self._normalize_name(name) in self._parts
+        key = self._normalize_name(name)
+        return key in self._parts or key in self._infos
 
     def read_part(self, name: str) -> bytes:
         key = self._normalize_name(name)
-        if key not in self._parts:
-            raise KeyError(f"Part not found: {name}")
-        return self._parts[key]
+        data = self._parts.get(key)
+        if data is None:
+            info = self._infos.get(key)
+            if info is None:
+                raise KeyError(f"Part not found: {name}")
+            data = self._zip.read(info)
+            self._parts[key] = data
+        return data
+
+    def cached(self, name: str, kind: str, build: Callable[[], Any]) -> Any:
+        key = self._normalize_name(name)
+        entries = self._part_cache.setdefault(key, {})
+        if kind not in entries:
+            entries[kind] = build()
+        return entries[kind]
+
+    def slide_order(self, build: Callable[[], list[str]]) -> list[str]:
+        if self._slide_parts is None:
+            self._slide_parts = build()
+        return list(self._slide_parts)
 
     def write_part(self, name: str, data: bytes) -> None:
         key = self._normalize_name(name)
-        if key not in self._parts:
+        is_new = not self.has_part(key)
+        if is_new:
             self._order.append(key)
+            self._index_name(key)
+        self._invalidate_slide_parts(key, structural=is_new)
+        self._part_cache.pop(key, None)
+        self._infos.pop(key, None)
         self._parts[key] = data
 
     def delete_part(self, name: str) -> None:
         key = self._normalize_name(name)
-        if key in self._parts:
-            del self._parts[key]
+        if not self.has_part(key):
+            return
+        self._invalidate_slide_parts(key, structural=True)
+        self._part_cache.pop(key, None)
+        self._unindex_name(key)
+        self._parts.pop(key, None)
+        self._infos.pop(key, None)
         self._order = [entry for entry in self._order if entry != key]
 
     def iter_parts(self) -> Iterable[PackagePart]:
         for name in self._order:
-            if name in self._parts:
-                yield PackagePart(name=name, data=self._parts[name])
+            yield PackagePart(name=name, data=self.read_part(name))
 
     def save_bytes(self) -> bytes:
         out = io.BytesIO()
-        with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zout:
-            written = set()
-            for part in self.iter_parts():
-                zout.writestr(part.name, part.data)
-                written.add(part.name)
-            for name, data in self._parts.items():
-                if name not in written:
-                    zout.writestr(name, data)
+        self.save_to(out)
         return out.getvalue()
 
+    def save_to(self, fp: BinaryIO) -> None:
+        with zipfile.ZipFile(fp, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+            for name in self._order:
+                info = self._infos.get(name)
+                if info is not None and not info.flag_bits & _FLAG_ENCRYPTED:
+                    self._copy_entry(zout, info)
+                    continue
+                data = self.read_part(name)
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if len(data) < MIN_DEFLATE_SIZE
+                    or name.lower().endswith(STORED_EXTENSIONS)
+                    else zipfile.ZIP_DEFLATED
+                )
+                zout.writestr(name, data, compress_type=compress_type)
+
+    def _copy_entry(self, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+        entry = _clone_info(info)
+        if not _copy_raw_entry(zout, self._source, info, entry):
+            zout.writestr(entry, self._zip.read(info), compress_type=info.compress_type)
+
+    def _index_name(self, name: str) -> None:
+        directory = name[: name.rfind("/") + 1]
+        self._by_prefix.setdefault(directory, []).append(name)
+
+    def _unindex_name(self, name: str) -> None:
+        directory = name[: name.rfind("/") + 1]
+        names = self._by_prefix[directory]
+        names.remove(name)
+        if not names:
+            del self._by_prefix[directory]
+
+    def _invalidate_slide_parts(self, key: str, *, structural: bool) -> None:
+        if key in SLIDE_INDEX_PARTS or (structural and key.startswith("ppt/slides/")):
+            self._slide_parts = None
+
     @staticmethod
     def _normalize_name(name: str) -> str:
         if name.startswith("/"):
             return name[1:]
         return name
+
+
+def _clone_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    entry = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    entry.compress_type = info.compress_type
+    entry.external_attr = info.external_attr
+    entry.create_system = info.create_system
+    return entry
+
+
+def _can_copy_raw(zout: zipfile.ZipFile) -> bool:
+    low, high = _RAW_COPY_VERSIONS
+    return (
+        low <= sys.version_info[:2] <= high
+        and all(hasattr(zout, attr) for attr in _ZIP_WRITER_STATE)
+        and not getattr(zout, "_writing", False)
+    )
+
+
+def _copy_raw_entry(
+    zout: zipfile.ZipFile,
+    source: memoryview,
+    info: zipfile.ZipInfo,
+    entry: zipfile.ZipInfo,
+) -> bool:
+    if not _can_copy_raw(zout):
+        return False
+    offset = info.header_offset
+    if source[offset : offset + 4] != _LOCAL_HEADER_SIGNATURE:
+        return False
+    name_len, extra_len = struct.unpack_from(
+        "<HH", source, offset + _LOCAL_HEADER_SIZE - 4
+    )
+    start = offset + _LOCAL_HEADER_SIZE + name_len + extra_len
+    raw = source[start : start + info.compress_size]
+    if len(raw) != info.compress_size:
+        return False
+
+    entry.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR
+    entry.CRC = info.CRC
+    entry.compress_size = info.compress_size
+    entry.file_size = info.file_size
+    entry.header_offset = zout.fp.tell()
+
+    zout.fp.write(entry.FileHeader())
+    zout.fp.write(raw)
+    zout.filelist.append(entry)
+    zout.NameToInfo[entry.filename] = entry
+    zout.start_dir = zout.fp.tell()
+    return True
@@ -3,13 +3,19 @@ from __future__ import annotations
 import posixpath
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator
 
 from .package import OOXMLPackage
+from .xmlutil import serialize_xml
 
 REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 
+_RELS_TAG = f"{{{REL_NS}}}Relationships"
+_REL_TAG = f"{{{REL_NS}}}Relationship"
 
-@dataclass
+
+@dataclass(slots=True)
 class Relationship:
     id: str
     type: str
@@ -17,6 +23,7 @@ class Relationship:
     target_mode: str | None = None
 
 
+@lru_cache(maxsize=1024)
 def rels_part_for(source_part: str) -> str:
     source = _strip_leading_slash(source_part)
     if source == "":
@@ -26,6 +33,7 @@ def rels_part_for(source_part: str) -> str:
     return posixpath.join(source_dir, "_rels", f"{source_base}.rels")
 
 
+@lru_cache(maxsize=1024)
 def source_part_for(rels_part: str) -> str:
     rels = _strip_leading_slash(rels_part)
     if rels == "_rels/.rels":
@@ -39,7 +47,7 @@ def source_part_for(rels_part: str) -> str:
 def parse_relationships(xml_bytes: bytes) -> list[Relationship]:
     root = ET.fromstring(xml_bytes)
     relationships = []
-    for rel in root.findall(f"{{{REL_NS}}}Relationship"):
+    for rel in root.findall(_REL_TAG):
         relationships.append(
             Relationship(
                 id=rel.attrib.get("Id", ""),
@@ -51,21 +59,36 @@ def parse_relationships(xml_bytes: bytes) -> list[Relationship]:
     return relationships
 
 
+def stream_relationships(xml_bytes: bytes) -> Iterator[tuple[str | None, str]]:
+    for node in ET.fromstring(xml_bytes).iter(_REL_TAG):
+        attrib = node.attrib
+        yield attrib.get("TargetMode"), attrib.get("Target", "")
+
+
 def serialize_relationships(relationships: list[Relationship]) -> bytes:
-    root = ET.Element(f"{{{REL_NS}}}Relationships")
+    root = ET.Element(_RELS_TAG)
     for rel in relationships:
         attrib = {"Id": rel.id, "Type": rel.type, "Target": rel.target}
         if rel.target_mode:
             attrib["TargetMode"] = rel.target_mode
-        ET.SubElement(root, f"{{{REL_NS}}}Relationship", attrib)
-    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+        ET.SubElement(root, _REL_TAG, attrib)
+    return serialize_xml(root)
 
 
 def get_relationships(pkg: OOXMLPackage, source_part: str) -> list[Relationship]:
     rels_part = rels_part_for(source_part)
     if not pkg.has_part(rels_part):
         return []
-    return parse_relationships(pkg.read_part(rels_part))
+    return read_relationships(pkg, rels_part)
+
+
+def read_relationships(pkg: OOXMLPackage, rels_part: str) -> list[Relationship]:
+    cached = pkg.cached(
+        rels_part,
+        "relationships",
+        lambda: parse_relationships(pkg.read_part(rels_part)),
+    )
+    return _copy_relationships(cached)
 
 
 def write_relationships(
@@ -78,10 +101,11 @@ def write_relationships(
 def ensure_relationship(
     pkg: OOXMLPackage, source_part: str, rel_type: str, target: str
 ) -> Relationship:
+    existing = _relationship_index(pkg, source_part).get((rel_type, target))
+    if existing is not None:
+        return _copy_relationships([existing])[0]
+
     relationships = get_relationships(pkg, source_part)
-    for rel in relationships:
-        if rel.type == rel_type and rel.target == target:
-            return rel
 
     next_id = _next_rid(relationships)
     new_rel = Relationship(id=next_id, type=rel_type, target=target)
@@ -90,12 +114,36 @@ def ensure_relationship(
     return new_rel
 
 
+def _relationship_index(
+    pkg: OOXMLPackage, source_part: str
+) -> dict[tuple[str, str], Relationship]:
+    rels_part = rels_part_for(source_part)
+
+    def build() -> dict[tuple[str, str], Relationship]:
+        index: dict[tuple[str, str], Relationship] = {}
+        for rel in get_relationships(pkg, source_part):
+            index.setdefault((rel.type, rel.target), rel)
+        return index
+
+    return pkg.cached(rels_part, "by_type_target", build)
+
+
+def _copy_relationships(relationships: list[Relationship]) -> list[Relationship]:
+    return [
+        Relationship(
+            id=rel.id, type=rel.type, target=rel.target, target_mode=rel.target_mode
+        )
+        for rel in relationships
+    ]
+
+
 def _next_rid(relationships: list[Relationship]) -> str:
-    existing = {rel.id for rel in relationships}
-    index = 1
-    while f"rId{index}" in existing:
-        index += 1
-    return f"rId{index}"
+    numbers = [
+        int(rel.id[3:])
+        for rel in relationships
+        if rel.id.startswith("rId") and rel.id[3:].isdigit()
+    ]
+    return f"rId{max(numbers, default=0) + 1}"
 
 
 def _strip_leading_slash(path: str) -> str:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import resources
 
 
+@lru_cache(maxsize=1)
 def load_base_template() -> bytes:
     return resources.files("potxkit.data").joinpath("base.potx").read_bytes()
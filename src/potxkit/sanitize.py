@@ -2,36 +2,56 @@ from __future__ import annotations
 
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, Iterable
 
 from .package import OOXMLPackage
-from .slide_index import slide_parts_in_order
+from .slide_index import select_slide_parts, slide_parts_in_order
+from .xmlutil import find_path, serialize_xml
 
 P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
 A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
 NS = {"p": P_NS, "a": A_NS}
 
-
-@dataclass
+_CLRMAP_OVR = f"{{{P_NS}}}clrMapOvr"
+_MASTER_CLR_MAPPING = f"{{{A_NS}}}masterClrMapping"
+_LSTSTYLE = f"{{{A_NS}}}lstStyle"
+_BODY_PR = f"{{{A_NS}}}bodyPr"
+_TXBODY = f"{{{P_NS}}}txBody"
+_NOFILL = f"{{{A_NS}}}noFill"
+_TRANSITION = f"{{{P_NS}}}transition"
+_CSLD = f"{{{P_NS}}}cSld"
+_BG = f"{{{P_NS}}}bg"
+_BG_PR = f"{{{P_NS}}}bgPr"
+_EFFECT_LST = f"{{{A_NS}}}effectLst"
+_BG_FILLS = frozenset(
+    f"{{{A_NS}}}{name}"
+    for name in ("solidFill", "gradFill", "blipFill", "pattFill", "noFill")
+)
+
+
+@dataclass(slots=True)
 class SanitizeResult:
     slides_updated: int
     clrmap_added: int
     lststyle_added: int
     bg_nofill_added: int
 
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "slides_updated": self.slides_updated,
+            "clrmap_added": self.clrmap_added,
+            "lststyle_added": self.lststyle_added,
+            "bg_nofill_added": self.bg_nofill_added,
+        }
+
 
 def sanitize_slides(
     pkg: OOXMLPackage, slide_numbers: Iterable[int] | None = None
 ) -> SanitizeResult:
-    slide_parts = slide_parts_in_order(pkg)
     if slide_numbers is not None:
-        requested = {num for num in slide_numbers}
-        selected = []
-        for num in sorted(requested):
-            if num < 1 or num > len(slide_parts):
-                raise ValueError("Slide number out of range")
-            selected.append(slide_parts[num - 1])
-        slide_parts = selected
+        slide_parts = select_slide_parts(pkg, slide_numbers)
+    else:
+        slide_parts = slide_parts_in_order(pkg)
 
     slides_updated = 0
     clrmap_added = 0
@@ -54,9 +74,7 @@ def sanitize_slides(
             changed = True
 
         if changed:
-            pkg.write_part(
-                slide_part, ET.tostring(root, encoding="utf-8", xml_declaration=True)
-            )
+            pkg.write_part(slide_part, serialize_xml(root))
             slides_updated += 1
 
     return SanitizeResult(
@@ -68,45 +86,49 @@ def sanitize_slides(
 
 
 def _ensure_clrmap_ovr(root: ET.Element) -> bool:
-    if root.find("p:clrMapOvr", NS) is not None:
-        return False
-    clrmap = ET.Element(f"{{{P_NS}}}clrMapOvr")
-    ET.SubElement(clrmap, f"{{{A_NS}}}masterClrMapping")
-
-    transition = root.find("p:transition", NS)
-    if transition is not None:
-        root.insert(list(root).index(transition), clrmap)
-    else:
-        root.append(clrmap)
+    transition_at = -1
+    for index, child in enumerate(root):
+        if child.tag == _CLRMAP_OVR:
+            return False
+        if child.tag == _TRANSITION and transition_at < 0:
+            transition_at = index
+    clrmap = ET.Element(_CLRMAP_OVR)
+    ET.SubElement(clrmap, _MASTER_CLR_MAPPING)
+    _insert_or_append(root, transition_at, clrmap)
     return True
 
 
 def _ensure_lststyle(root: ET.Element) -> int:
     added = 0
-    for tx_body in root.findall(".//p:txBody", NS):
-        if tx_body.find("a:lstStyle", NS) is not None:
-            continue
-        lst = ET.Element(f"{{{A_NS}}}lstStyle")
-        body_pr = tx_body.find("a:bodyPr", NS)
-        if body_pr is not None:
-            tx_body.insert(list(tx_body).index(body_pr) + 1, lst)
+    for tx_body in root.iter(_TXBODY):
+        insert_at = 0
+        for index, child in enumerate(tx_body):
+            if child.tag == _LSTSTYLE:
+                break
+            if child.tag == _BODY_PR and not insert_at:
+                insert_at = index + 1
         else:
-            tx_body.insert(0, lst)
-        added += 1
+            tx_body.insert(insert_at, ET.Element(_LSTSTYLE))
+            added += 1
     return added
 
 
 def _ensure_bg_nofill(root: ET.Element) -> int:
-    bg_pr = root.find("p:cSld/p:bg/p:bgPr", NS)
+    bg_pr = find_path(root, _CSLD, _BG, _BG_PR)
     if bg_pr is None:
         return 0
-    for tag in ["a:solidFill", "a:gradFill", "a:blipFill", "a:pattFill", "a:noFill"]:
-        if bg_pr.find(tag, NS) is not None:
+    effect_at = -1
+    for index, child in enumerate(bg_pr):
+        if child.tag in _BG_FILLS:
             return 0
-    no_fill = ET.Element(f"{{{A_NS}}}noFill")
-    effect = bg_pr.find("a:effectLst", NS)
-    if effect is not None:
-        bg_pr.insert(list(bg_pr).index(effect), no_fill)
-    else:
-        bg_pr.append(no_fill)
+        if child.tag == _EFFECT_LST and effect_at < 0:
+            effect_at = index
+    _insert_or_append(bg_pr, effect_at, ET.Element(_NOFILL))
     return 1
+
+
+def _insert_or_append(parent: ET.Element, index: int, child: ET.Element) -> None:
+    if index < 0:
+        parent.append(child)
+    else:
+        parent.insert(index, child)
@@ -2,17 +2,34 @@ from __future__ import annotations
 
 import posixpath
 import xml.etree.ElementTree as ET
+from typing import Iterable
 
 from .package import OOXMLPackage
+from .rels import read_relationships
 
 P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
 R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 
 NS = {"p": P_NS, "r": R_NS}
 
+_SLD_ID_LST = f"{{{P_NS}}}sldIdLst"
+_SLD_ID = f"{{{P_NS}}}sldId"
+_R_ID = f"{{{R_NS}}}id"
+
 
 def slide_parts_in_order(pkg: OOXMLPackage) -> list[str]:
+    return pkg.slide_order(lambda: _slide_parts_in_order(pkg))
+
+
+def select_slide_parts(pkg: OOXMLPackage, slide_numbers: Iterable[int]) -> list[str]:
+    slide_parts = slide_parts_in_order(pkg)
+    numbers = sorted(set(slide_numbers))
+    if numbers and (numbers[0] < 1 or numbers[-1] > len(slide_parts)):
+        raise ValueError("Slide number out of range")
+    return [slide_parts[num - 1] for num in numbers]
+
+
+def _slide_parts_in_order(pkg: OOXMLPackage) -> list[str]:
     if not pkg.has_part("ppt/presentation.xml") or not pkg.has_part(
         "ppt/_rels/presentation.xml.rels"
     ):
@@ -21,9 +38,11 @@ def slide_parts_in_order(pkg: OOXMLPackage) -> list[str]:
     presentation = ET.fromstring(pkg.read_part("ppt/presentation.xml"))
     rels = _read_rels(pkg, "ppt/_rels/presentation.xml.rels")
 
+    sld_id_lst = presentation.find(_SLD_ID_LST)
+    sld_ids = sld_id_lst.findall(_SLD_ID) if sld_id_lst is not None else []
     slide_parts = []
-    for sld_id in presentation.findall("p:sldIdLst/p:sldId", NS):
-        rid = sld_id.attrib.get(f"{{{R_NS}}}id")
+    for sld_id in sld_ids:
+        rid = sld_id.attrib.get(_R_ID)
         if not rid or rid not in rels:
             continue
         rel_type, target = rels[rid]
@@ -35,26 +54,17 @@ def slide_parts_in_order(pkg: OOXMLPackage) -> list[str]:
 
 
 def _fallback_slide_parts(pkg: OOXMLPackage) -> list[str]:
-    return sorted(
-        [
-            p
-            for p in pkg.list_parts()
-            if p.startswith("ppt/slides/slide") and p.endswith(".xml")
-        ]
-    )
+    return [p for p in pkg.parts_under("ppt/slides/slide") if p.endswith(".xml")]
 
 
 def _read_rels(pkg: OOXMLPackage, rels_part: str) -> dict[str, tuple[str, str]]:
     if not pkg.has_part(rels_part):
         return {}
-    root = ET.fromstring(pkg.read_part(rels_part))
-    rels: dict[str, tuple[str, str]] = {}
-    for rel in root.findall(f"{{{REL_NS}}}Relationship"):
-        rid = rel.attrib.get("Id")
-        if not rid:
-            continue
-        rels[rid] = (rel.attrib.get("Type", ""), rel.attrib.get("Target", ""))
-    return rels
+    return {
+        rel.id: (rel.type, rel.target)
+        for rel in read_relationships(pkg, rels_part)
+        if rel.id
+    }
 
 
 def _resolve_target(base_dir: str, target: str) -> str:
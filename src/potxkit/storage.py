@@ -1,19 +1,44 @@
 from __future__ import annotations
 
+import os
+import uuid
 from typing import Any
 
 import fsspec
 
+from .package import OOXMLPackage
 
-def read_bytes(uri: str, *, fs_kwargs: dict[str, Any] | None = None) -> bytes:
+
+def read_bytes(
+    uri: str | os.PathLike[str], *, fs_kwargs: dict[str, Any] | None = None
+) -> bytes:
     fs_kwargs = fs_kwargs or {}
     with fsspec.open(uri, "rb", **fs_kwargs) as handle:
         return handle.read()
 
 
 def write_bytes(
-    uri: str, data: bytes, *, fs_kwargs: dict[str, Any] | None = None
+    uri: str | os.PathLike[str], data: bytes, *, fs_kwargs: dict[str, Any] | None = None
 ) -> None:
     fs_kwargs = fs_kwargs or {}
     with fsspec.open(uri, "wb", **fs_kwargs) as handle:
         handle.write(data)
+
+
+def save_package(
+    pkg: OOXMLPackage,
+    uri: str | os.PathLike[str],
+    *,
+    fs_kwargs: dict[str, Any] | None = None,
+) -> None:
+    fs_kwargs = fs_kwargs or {}
+    fs, path = fsspec.core.url_to_fs(uri, **fs_kwargs)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with fs.open(tmp_path, "wb") as handle:
+            pkg.save_to(handle)
+        fs.mv(tmp_path, path)
+    except BaseException:
+        if fs.exists(tmp_path):
+            fs.rm(tmp_path)
+        raise
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import os
 import posixpath
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO
 
 from .content_types import ensure_override
 from .package import OOXMLPackage
 from .rels import ensure_relationship
 from .resources import load_base_template
-from .storage import read_bytes, write_bytes
+from .storage import read_bytes, save_package
 from .theme import Theme
 from .validate import ValidationReport, validate_package
 
@@ -16,6 +17,7 @@ THEME_REL_TYPE = (
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
 )
 THEME_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.theme+xml"
+PRESENTATION_PART = "ppt/presentation.xml"
 
 
 @dataclass
@@ -23,12 +25,24 @@ class PotxTemplate:
     _package: OOXMLPackage
     _theme_path: str
     _theme: Theme | None = None
+    _theme_override: str = field(init=False, repr=False)
+    _theme_rel_target: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._theme_override = f"/{self._theme_path}"
+        self._theme_rel_target = _rel_target(PRESENTATION_PART, self._theme_path)
 
     @classmethod
     def open(
-        cls, uri: str, *, fs_kwargs: dict[str, Any] | None = None
+        cls,
+        uri: str | os.PathLike[str] | BinaryIO,
+        *,
+        fs_kwargs: dict[str, Any] | None = None,
     ) -> "PotxTemplate":
-        data = read_bytes(uri, fs_kwargs=fs_kwargs)
+        if hasattr(uri, "read"):
+            data = uri.read()
+        else:
+            data = read_bytes(uri, fs_kwargs=fs_kwargs)
         pkg = OOXMLPackage(data)
         theme_path = _find_theme_part(pkg)
         return cls(pkg, theme_path)
@@ -40,43 +54,57 @@ class PotxTemplate:
         theme_path = _find_theme_part(pkg)
         return cls(pkg, theme_path)
 
+    @property
+    def package(self) -> OOXMLPackage:
+        return self._package
+
     @property
     def theme(self) -> Theme:
         if self._theme is None:
             self._theme = Theme.from_bytes(self._package.read_part(self._theme_path))
         return self._theme
 
-    def save(self, uri: str, *, fs_kwargs: dict[str, Any] | None = None) -> None:
+    def save(
+        self,
+        uri: str | os.PathLike[str] | BinaryIO,
+        *,
+        fs_kwargs: dict[str, Any] | None = None,
+    ) -> None:
         if self._theme is not None:
-            self._package.write_part(self._theme_path, self._theme.to_bytes())
+            data = self._theme.to_bytes()
+            if data != self._package.read_part(self._theme_path):
+                self._package.write_part(self._theme_path, data)
         self._ensure_theme_relationship()
-        ensure_override(self._package, f"/{self._theme_path}", THEME_CONTENT_TYPE)
-        write_bytes(uri, self._package.save_bytes(), fs_kwargs=fs_kwargs)
+        ensure_override(self._package, self._theme_override, THEME_CONTENT_TYPE)
+        if hasattr(uri, "write"):
+            self._package.save_to(uri)
+            return
+        save_package(self._package, uri, fs_kwargs=fs_kwargs)
 
     def validate(self) -> ValidationReport:
         return validate_package(self._package, self._theme_path)
 
     def _ensure_theme_relationship(self) -> None:
-        if not self._package.has_part("ppt/presentation.xml"):
+        if not self._package.has_part(PRESENTATION_PART):
             return
-        source_part = "ppt/presentation.xml"
-        target = _rel_target(source_part, self._theme_path)
-        ensure_relationship(self._package, source_part, THEME_REL_TYPE, target)
+        ensure_relationship(
+            self._package, PRESENTATION_PART, THEME_REL_TYPE, self._theme_rel_target
+        )
 
 
 def _find_theme_part(pkg: OOXMLPackage) -> str:
+    if pkg.has_part("ppt/theme/theme1.xml"):
+        return "ppt/theme/theme1.xml"
     candidates = [
-        name
-        for name in pkg.list_parts()
-        if name.startswith("ppt/theme/") and name.endswith(".xml")
+        name for name in pkg.parts_under("ppt/theme/") if name.endswith(".xml")
     ]
     if not candidates:
         raise KeyError("No theme part found in package")
-    if "ppt/theme/theme1.xml" in candidates:
-        return "ppt/theme/theme1.xml"
-    return sorted(candidates)[0]
+    return min(candidates)
 
 
 def _rel_target(source_part: str, target_part: str) -> str:
-    source_dir = posixpath.dirname(source_part)
-    return posixpath.relpath(target_part, start=source_dir)
+    source_dir = source_part[: source_part.rfind("/") + 1]
+    if target_part.startswith(source_dir) and "/." not in target_part:
+        return target_part[len(source_dir) :]
+    return posixpath.relpath(target_part, start=posixpath.dirname(source_part))
@@ -1,13 +1,45 @@
 from __future__ import annotations
 
-import re
+import copy
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
+from functools import lru_cache
+
+from .xmlutil import serialize_xml
 
 A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
 NS = {"a": A_NS}
 ET.register_namespace("a", A_NS)
 
+COLOR_SLOTS = (
+    "dk1",
+    "lt1",
+    "dk2",
+    "lt2",
+    "accent1",
+    "accent2",
+    "accent3",
+    "accent4",
+    "accent5",
+    "accent6",
+    "hlink",
+    "folHlink",
+)
+
+_SRGB_CLR = f"{{{A_NS}}}srgbClr"
+_SYS_CLR = f"{{{A_NS}}}sysClr"
+_LATIN = f"{{{A_NS}}}latin"
+_EA = f"{{{A_NS}}}ea"
+_CS = f"{{{A_NS}}}cs"
+_THEME_ELEMENTS = f"{{{A_NS}}}themeElements"
+_CLR_SCHEME = f"{{{A_NS}}}clrScheme"
+_FONT_SCHEME = f"{{{A_NS}}}fontScheme"
+_MAJOR_FONT = f"{{{A_NS}}}majorFont"
+_MINOR_FONT = f"{{{A_NS}}}minorFont"
+_TAG_BY_SLOT = {slot: f"{{{A_NS}}}{slot}" for slot in COLOR_SLOTS}
+_SLOT_BY_TAG = {tag: slot for slot, tag in _TAG_BY_SLOT.items()}
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
 
 @dataclass
 class ThemeFontSpec:
@@ -63,41 +95,29 @@ class ThemeColors:
         self._set_slot_hex("folHlink", value)
 
     def as_dict(self) -> dict[str, str | None]:
-        slots = [
-            "dk1",
-            "lt1",
-            "dk2",
-            "lt2",
-            "accent1",
-            "accent2",
-            "accent3",
-            "accent4",
-            "accent5",
-            "accent6",
-            "hlink",
-            "folHlink",
-        ]
-        return {slot: self._get_slot_hex(slot) for slot in slots}
+        colors: dict[str, str | None] = dict.fromkeys(COLOR_SLOTS)
+        seen: set[str] = set()
+        for child in self._clr_scheme:
+            slot = _SLOT_BY_TAG.get(child.tag)
+            if slot is None or slot in seen:
+                continue
+            seen.add(slot)
+            colors[slot] = _slot_hex(child)
+        return colors
 
     def _get_slot_hex(self, name: str) -> str | None:
-        slot = self._clr_scheme.find(f"a:{name}", NS)
+        slot = self._clr_scheme.find(_slot_tag(name))
         if slot is None:
             return None
-        srgb = slot.find("a:srgbClr", NS)
-        if srgb is not None and srgb.attrib.get("val"):
-            return f"#{srgb.attrib['val'].upper()}"
-        sysclr = slot.find("a:sysClr", NS)
-        if sysclr is not None and sysclr.attrib.get("lastClr"):
-            return f"#{sysclr.attrib['lastClr'].upper()}"
-        return None
+        return _slot_hex(slot)
 
     def _set_slot_hex(self, name: str, value: str) -> None:
-        slot = self._clr_scheme.find(f"a:{name}", NS)
+        tag = _slot_tag(name)
+        slot = self._clr_scheme.find(tag)
         if slot is None:
-            slot = ET.SubElement(self._clr_scheme, f"{{{A_NS}}}{name}")
-        for child in list(slot):
-            slot.remove(child)
-        srgb = ET.SubElement(slot, f"{{{A_NS}}}srgbClr")
+            slot = ET.SubElement(self._clr_scheme, tag)
+        del slot[:]
+        srgb = ET.SubElement(slot, _SRGB_CLR)
         srgb.set("val", _normalize_hex(value))
 
 
@@ -106,10 +126,10 @@ class ThemeFonts:
         self._font_scheme = font_scheme
 
     def get_major(self) -> ThemeFontSpec | None:
-        return self._get_font_spec("majorFont")
+        return self._get_font_spec(_MAJOR_FONT)
 
     def get_minor(self) -> ThemeFontSpec | None:
-        return self._get_font_spec("minorFont")
+        return self._get_font_spec(_MINOR_FONT)
 
     def set_major(
         self,
@@ -117,7 +137,7 @@ class ThemeFonts:
         east_asian: str | None = None,
         complex_script: str | None = None,
     ) -> None:
-        self._set_font_spec("majorFont", latin, east_asian, complex_script)
+        self._set_font_spec(_MAJOR_FONT, latin, east_asian, complex_script)
 
     def set_minor(
         self,
@@ -125,17 +145,17 @@ class ThemeFonts:
         east_asian: str | None = None,
         complex_script: str | None = None,
     ) -> None:
-        self._set_font_spec("minorFont", latin, east_asian, complex_script)
+        self._set_font_spec(_MINOR_FONT, latin, east_asian, complex_script)
 
-    def _get_font_spec(self, name: str) -> ThemeFontSpec | None:
-        node = self._font_scheme.find(f"a:{name}", NS)
+    def _get_font_spec(self, tag: str) -> ThemeFontSpec | None:
+        node = self._font_scheme.find(tag)
         if node is None:
             return None
-        latin = node.find("a:latin", NS)
+        latin = node.find(_LATIN)
         if latin is None:
             return None
-        ea = node.find("a:ea", NS)
-        cs = node.find("a:cs", NS)
+        ea = node.find(_EA)
+        cs = node.find(_CS)
         return ThemeFontSpec(
             latin=latin.attrib.get("typeface", ""),
             east_asian=ea.attrib.get("typeface") if ea is not None else None,
@@ -144,29 +164,36 @@ class ThemeFonts:
 
     def _set_font_spec(
         self,
-        name: str,
+        tag: str,
         latin: str,
         east_asian: str | None,
         complex_script: str | None,
     ) -> None:
-        node = self._font_scheme.find(f"a:{name}", NS)
+        node = self._font_scheme.find(tag)
         if node is None:
-            node = ET.SubElement(self._font_scheme, f"{{{A_NS}}}{name}")
-        _set_font_child(node, "latin", latin)
+            node = ET.SubElement(self._font_scheme, tag)
+        _set_font_child(node, _LATIN, latin)
         if east_asian is not None:
-            _set_font_child(node, "ea", east_asian)
+            _set_font_child(node, _EA, east_asian)
         if complex_script is not None:
-            _set_font_child(node, "cs", complex_script)
+            _set_font_child(node, _CS, complex_script)
 
 
 class Theme:
     def __init__(self, root: ET.Element) -> None:
         self._root = root
-        theme_elements = root.find("a:themeElements", NS)
+        theme_elements = root.find(_THEME_ELEMENTS)
         if theme_elements is None:
             raise ValueError("Theme is missing themeElements")
-        clr_scheme = theme_elements.find("a:clrScheme", NS)
-        font_scheme = theme_elements.find("a:fontScheme", NS)
+        clr_scheme = None
+        font_scheme = None
+        for child in theme_elements:
+            if child.tag == _CLR_SCHEME and clr_scheme is None:
+                clr_scheme = child
+            elif child.tag == _FONT_SCHEME and font_scheme is None:
+                font_scheme = child
+            if clr_scheme is not None and font_scheme is not None:
+                break
         if clr_scheme is None:
             raise ValueError("Theme is missing clrScheme")
         if font_scheme is None:
@@ -178,11 +205,10 @@ class Theme:
 
     @classmethod
     def from_bytes(cls, xml_bytes: bytes) -> "Theme":
-        root = ET.fromstring(xml_bytes)
-        return cls(root)
+        return cls(copy.deepcopy(_parse_theme(xml_bytes)))
 
     def to_bytes(self) -> bytes:
-        return ET.tostring(self._root, encoding="utf-8", xml_declaration=True)
+        return serialize_xml(self._root)
 
     def get_name(self) -> str | None:
         return self._root.attrib.get("name")
@@ -203,15 +229,34 @@ class Theme:
         self._font_scheme.set("name", value)
 
 
+@lru_cache(maxsize=32)
+def _parse_theme(xml_bytes: bytes) -> ET.Element:
+    return ET.fromstring(xml_bytes)
+
+
+def _slot_tag(name: str) -> str:
+    return _TAG_BY_SLOT.get(name) or f"{{{A_NS}}}{name}"
+
+
+def _slot_hex(slot: ET.Element) -> str | None:
+    srgb = slot.find(_SRGB_CLR)
+    if srgb is not None and srgb.attrib.get("val"):
+        return f"#{srgb.attrib['val'].upper()}"
+    sysclr = slot.find(_SYS_CLR)
+    if sysclr is not None and sysclr.attrib.get("lastClr"):
+        return f"#{sysclr.attrib['lastClr'].upper()}"
+    return None
+
+
 def _normalize_hex(value: str) -> str:
     value = value.strip().lstrip("#")
-    if not re.fullmatch(r"[0-9a-fA-F]{6}", value):
+    if len(value) != 6 or not _HEX_DIGITS.issuperset(value):
         raise ValueError(f"Invalid hex color: {value}")
     return value.upper()
 
 
 def _set_font_child(node: ET.Element, tag: str, typeface: str) -> None:
-    child = node.find(f"a:{tag}", NS)
+    child = node.find(tag)
     if child is None:
-        child = ET.SubElement(node, f"{{{A_NS}}}{tag}")
+        child = ET.SubElement(node, tag)
     child.set("typeface", typeface)
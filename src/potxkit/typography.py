@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
-from collections import Counter
 from dataclasses import dataclass
 from typing import Any
 
+from .formatting import run_properties
+
 P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
 A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
 
@@ -13,6 +14,18 @@ NS = {"p": P_NS, "a": A_NS}
 TITLE_TYPES = {"title", "ctrTitle"}
 BODY_TYPES = {"body"}
 
+_SP = f"{{{P_NS}}}sp"
+_NV_SP_PR = f"{{{P_NS}}}nvSpPr"
+_NV_PR = f"{{{P_NS}}}nvPr"
+_PH = f"{{{P_NS}}}ph"
+_TX_STYLES = f"{{{P_NS}}}txStyles"
+_TITLE_STYLE = f"{{{P_NS}}}titleStyle"
+_BODY_STYLE = f"{{{P_NS}}}bodyStyle"
+_DEF_RPR = f"{{{A_NS}}}defRPr"
+_LST_STYLE = f"{{{A_NS}}}lstStyle"
+_TX_BODY = f"{{{A_NS}}}txBody"
+_LVL1_PPR = f"{{{A_NS}}}lvl1pPr"
+
 
 @dataclass
 class TextStyleStats:
@@ -21,24 +34,28 @@ class TextStyleStats:
 
 
 def extract_text_style_stats(root: ET.Element) -> TextStyleStats:
-    sizes: Counter[str] = Counter()
-    bold: Counter[str] = Counter()
-
-    for node in root.findall(".//a:rPr", NS) + root.findall(".//a:defRPr", NS):
-        sz = node.attrib.get("sz")
-        if sz and sz.isdigit():
-            sizes[sz] += 1
-        bold_flag = node.attrib.get("b")
+    sizes: dict[str, int] = {}
+    bold: dict[str, int] = {}
+
+    for node in run_properties(root):
+        attrib = node.attrib
+        sz = attrib.get("sz")
+        if sz is not None:
+            sizes[sz] = sizes.get(sz, 0) + 1
+        bold_flag = attrib.get("b")
         if bold_flag is not None:
-            bold[bold_flag] += 1
+            bold[bold_flag] = bold.get(bold_flag, 0) + 1
 
-    return TextStyleStats(size_counts=dict(sizes), bold_counts=dict(bold))
+    return TextStyleStats(
+        size_counts={sz: count for sz, count in sizes.items() if sz.isdigit()},
+        bold_counts=bold,
+    )
 
 
 def detect_placeholder_styles(root: ET.Element) -> dict[str, dict[str, Any]]:
     styles: dict[str, dict[str, Any]] = {}
-    for shape in root.findall(".//p:sp", NS):
-        ph = shape.find("p:nvSpPr/p:nvPr/p:ph", NS)
+    for shape in root.iter(_SP):
+        ph = _placeholder(shape)
         if ph is None:
             continue
         ph_type = ph.attrib.get("type", "body")
@@ -51,7 +68,7 @@ def detect_placeholder_styles(root: ET.Element) -> dict[str, dict[str, Any]]:
             continue
         sizes = []
         bolds = []
-        for rpr in shape.findall(".//a:rPr", NS) + shape.findall(".//a:defRPr", NS):
+        for rpr in run_properties(shape):
             sz = rpr.attrib.get("sz")
             if sz and sz.isdigit():
                 sizes.append(int(sz))
@@ -60,35 +77,58 @@ def detect_placeholder_styles(root: ET.Element) -> dict[str, dict[str, Any]]:
                 bolds.append(b)
         if not sizes and not bolds:
             continue
-        sizes_counter = Counter(sizes)
-        bold_counter = Counter(bolds)
         styles[category] = {
-            "size_pt": _sz_to_pt(_most_common(sizes_counter)),
-            "bold": _most_common(bold_counter) == "1" if bold_counter else None,
+            "size_pt": _sz_to_pt(_mode(sizes)),
+            "bold": _mode(bolds) == "1" if bolds else None,
         }
     return styles
 
 
-def set_layout_text_styles(
+def apply_text_styles(
     root: ET.Element,
     title_size_pt: float | None,
     title_bold: bool | None,
     body_size_pt: float | None,
     body_bold: bool | None,
+    *,
+    placeholders: bool = True,
+    tx_styles: bool = True,
 ) -> int:
     updated = 0
-    for shape in root.findall(".//p:sp", NS):
-        ph = shape.find("p:nvSpPr/p:nvPr/p:ph", NS)
-        if ph is None:
-            continue
-        ph_type = ph.attrib.get("type", "body")
-        if ph_type in TITLE_TYPES:
-            updated += _apply_shape_style(shape, title_size_pt, title_bold)
-        elif ph_type in BODY_TYPES:
-            updated += _apply_shape_style(shape, body_size_pt, body_bold)
+    if tx_styles:
+        styles = root.find(_TX_STYLES)
+        if styles is not None:
+            title_style = styles.find(_TITLE_STYLE)
+            body_style = styles.find(_BODY_STYLE)
+            if title_style is not None:
+                updated += _apply_level_style(title_style, title_size_pt, title_bold)
+            if body_style is not None:
+                updated += _apply_level_style(body_style, body_size_pt, body_bold)
+    if placeholders:
+        for shape in root.iter(_SP):
+            ph = _placeholder(shape)
+            if ph is None:
+                continue
+            ph_type = ph.attrib.get("type", "body")
+            if ph_type in TITLE_TYPES:
+                updated += _apply_shape_style(shape, title_size_pt, title_bold)
+            elif ph_type in BODY_TYPES:
+                updated += _apply_shape_style(shape, body_size_pt, body_bold)
     return updated
 
 
+def set_layout_text_styles(
+    root: ET.Element,
+    title_size_pt: float | None,
+    title_bold: bool | None,
+    body_size_pt: float | None,
+    body_bold: bool | None,
+) -> int:
+    return apply_text_styles(
+        root, title_size_pt, title_bold, body_size_pt, body_bold, tx_styles=False
+    )
+
+
 def set_master_text_styles(
     root: ET.Element,
     title_size_pt: float | None,
@@ -96,19 +136,18 @@ def set_master_text_styles(
     body_size_pt: float | None,
     body_bold: bool | None,
 ) -> int:
-    updated = 0
-    tx_styles = root.find("p:txStyles", NS)
-    if tx_styles is None:
-        return 0
-    title_style = tx_styles.find("p:titleStyle", NS)
-    body_style = tx_styles.find("p:bodyStyle", NS)
+    return apply_text_styles(
+        root, title_size_pt, title_bold, body_size_pt, body_bold, placeholders=False
+    )
 
-    if title_style is not None:
-        updated += _apply_level_style(title_style, title_size_pt, title_bold)
-    if body_style is not None:
-        updated += _apply_level_style(body_style, body_size_pt, body_bold)
 
-    return updated
+def _placeholder(shape: ET.Element) -> ET.Element | None:
+    node = shape.find(_NV_SP_PR)
+    if node is not None:
+        node = node.find(_NV_PR)
+    if node is not None:
+        node = node.find(_PH)
+    return node
 
 
 def _apply_shape_style(
@@ -116,30 +155,30 @@ def _apply_shape_style(
 ) -> int:
     if size_pt is None and bold is None:
         return 0
-    lst_style = shape.find(".//a:lstStyle", NS)
+    lst_style = next(shape.iter(_LST_STYLE), None)
     if lst_style is None:
-        tx_body = shape.find(".//a:txBody", NS)
+        tx_body = next(shape.iter(_TX_BODY), None)
         if tx_body is None:
             return 0
-        lst_style = ET.SubElement(tx_body, f"{{{A_NS}}}lstStyle")
-    lvl = lst_style.find("a:lvl1pPr", NS)
+        lst_style = ET.SubElement(tx_body, _LST_STYLE)
+    lvl = lst_style.find(_LVL1_PPR)
     if lvl is None:
-        lvl = ET.SubElement(lst_style, f"{{{A_NS}}}lvl1pPr")
-    def_rpr = lvl.find("a:defRPr", NS)
+        lvl = ET.SubElement(lst_style, _LVL1_PPR)
+    def_rpr = lvl.find(_DEF_RPR)
     if def_rpr is None:
-        def_rpr = ET.SubElement(lvl, f"{{{A_NS}}}defRPr")
+        def_rpr = ET.SubElement(lvl, _DEF_RPR)
     return _set_rpr(def_rpr, size_pt, bold)
 
 
 def _apply_level_style(
     container: ET.Element, size_pt: float | None, bold: bool | None
 ) -> int:
-    lvl = container.find("a:lvl1pPr", NS)
+    lvl = container.find(_LVL1_PPR)
     if lvl is None:
-        lvl = ET.SubElement(container, f"{{{A_NS}}}lvl1pPr")
-    def_rpr = lvl.find("a:defRPr", NS)
+        lvl = ET.SubElement(container, _LVL1_PPR)
+    def_rpr = lvl.find(_DEF_RPR)
     if def_rpr is None:
-        def_rpr = ET.SubElement(lvl, f"{{{A_NS}}}defRPr")
+        def_rpr = ET.SubElement(lvl, _DEF_RPR)
     return _set_rpr(def_rpr, size_pt, bold)
 
 
@@ -164,7 +203,10 @@ def _sz_to_pt(value: int | None) -> float | None:
     return value / 100
 
 
-def _most_common(counter: Counter) -> Any:
-    if not counter:
+def _mode(values: list[Any]) -> Any:
+    if not values:
         return None
-    return counter.most_common(1)[0][0]
+    counts: dict[Any, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return max(counts, key=counts.__getitem__)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import posixpath
 from dataclasses import dataclass, field
 
 from .content_types import has_override
 from .package import OOXMLPackage
-from .rels import parse_relationships, source_part_for
+from .rels import source_part_for, stream_relationships
 
 
 @dataclass
@@ -36,14 +35,13 @@ def _validate_relationship_targets(pkg: OOXMLPackage, report: ValidationReport)
     parts = pkg.list_parts()
     rels_parts = [name for name in parts if name.endswith(".rels")]
     for rels_part in rels_parts:
-        xml_bytes = pkg.read_part(rels_part)
-        for rel in parse_relationships(xml_bytes):
-            if rel.target_mode == "External":
+        source_part = source_part_for(rels_part)
+        for target_mode, rel_target in stream_relationships(pkg.read_part(rels_part)):
+            if target_mode == "External":
                 continue
-            source_part = source_part_for(rels_part)
-            target = _resolve_target(source_part, rel.target)
+            target = _resolve_target(source_part, rel_target)
             if target and not pkg.has_part(target):
-                report.errors.append(f"Missing rel target: {rels_part} -> {rel.target}")
+                report.errors.append(f"Missing rel target: {rels_part} -> {rel_target}")
 
 
 def _resolve_target(source_part: str, target: str) -> str | None:
@@ -51,6 +49,13 @@ def _resolve_target(source_part: str, target: str) -> str | None:
         return target[1:]
     if source_part == "":
         return target
-    source_dir = posixpath.dirname(source_part)
-    resolved = posixpath.normpath(posixpath.join(source_dir, target))
-    return resolved
+    segments = source_part.split("/")[:-1]
+    for segment in target.split("/"):
+        if segment == "..":
+            if segments and segments[-1] != "..":
+                segments.pop()
+            else:
+                segments.append(segment)
+        elif segment and segment != ".":
+            segments.append(segment)
+    return "/".join(segments) or "."
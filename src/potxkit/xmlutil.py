@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+
+XML_DECL = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+
+def serialize_xml(root: ET.Element) -> bytes:
+    return XML_DECL + ET.tostring(root, encoding="utf-8")
+
+
+def find_path(node: ET.Element | None, *tags: str) -> ET.Element | None:
+    for tag in tags:
+        if node is None:
+            return None
+        node = node.find(tag)
+    return node
@@ -2,6 +2,53 @@ from __future__ import annotations
 
 import io
 import zipfile
+from typing import Callable
+
+import pytest
+
+from potxkit.package import OOXMLPackage
+
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+@pytest.fixture(scope="session")
+def minimal_potx_bytes() -> bytes:
+    return build_minimal_potx()
+
+
+@pytest.fixture(scope="session")
+def minimal_pptx_bytes() -> bytes:
+    return build_minimal_pptx()
+
+
+@pytest.fixture(scope="session")
+def deck_bytes() -> bytes:
+    return build_deck()
+
+
+@pytest.fixture(scope="session")
+def slide_pkg_bytes() -> bytes:
+    return build_slide_pkg()
+
+
+@pytest.fixture
+def record_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[OOXMLPackage], list[str]]:
+    def record(pkg: OOXMLPackage) -> list[str]:
+        writes: list[str] = []
+        write_part = pkg.write_part
+
+        def _record(name: str, data: bytes) -> None:
+            writes.append(name)
+            write_part(name, data)
+
+        monkeypatch.setattr(pkg, "write_part", _record)
+        return writes
+
+    return record
 
 
 def build_minimal_potx(*, include_theme_rel: bool = True) -> bytes:
@@ -35,7 +82,7 @@ def build_minimal_potx(*, include_theme_rel: bool = True) -> bytes:
     )
 
     out = io.BytesIO()
-    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as zout:
         zout.writestr("ppt/theme/theme1.xml", theme_xml)
         zout.writestr("ppt/presentation.xml", presentation_xml)
         zout.writestr("ppt/_rels/presentation.xml.rels", rels_xml)
@@ -43,6 +90,266 @@ def build_minimal_potx(*, include_theme_rel: bool = True) -> bytes:
     return out.getvalue()
 
 
+def build_minimal_pptx() -> bytes:
+    presentation = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:presentation xmlns:p="{P_NS}" xmlns:r="{R_NS}">'
+        "<p:sldIdLst>"
+        '<p:sldId id="256" r:id="rId1"/>'
+        '<p:sldId id="257" r:id="rId2"/>'
+        "</p:sldIdLst>"
+        "</p:presentation>"
+    )
+
+    pres_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide" '
+        'Target="slides/slide1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide" '
+        'Target="slides/slide2.xml"/>'
+        "</Relationships>"
+    )
+
+    slide1 = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:sld xmlns:p="{P_NS}" xmlns:a="{A_NS}">'
+        "<p:cSld><p:spTree>"
+        '<p:sp><p:spPr><a:solidFill><a:srgbClr val="111111"/></a:solidFill></p:spPr></p:sp>'
+        "</p:spTree></p:cSld></p:sld>"
+    )
+
+    slide2 = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:sld xmlns:p="{P_NS}" xmlns:a="{A_NS}">'
+        "<p:cSld><p:spTree>"
+        '<p:sp><p:spPr><a:solidFill><a:srgbClr val="222222"/></a:solidFill></p:spPr></p:sp>'
+        "</p:spTree></p:cSld></p:sld>"
+    )
+
+    master = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:sldMaster xmlns:p="{P_NS}" xmlns:a="{A_NS}" xmlns:r="{R_NS}">'
+        "<p:cSld><p:spTree/></p:cSld>"
+        '<p:sldLayoutIdLst><p:sldLayoutId id="256" r:id="rId1"/></p:sldLayoutIdLst>'
+        "</p:sldMaster>"
+    )
+
+    layout = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:sldLayout xmlns:p="{P_NS}" xmlns:a="{A_NS}" xmlns:r="{R_NS}">'
+        "<p:cSld><p:spTree/></p:cSld></p:sldLayout>"
+    )
+
+    master_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" '
+        'Target="../slideLayouts/slideLayout1.xml"/>'
+        "</Relationships>"
+    )
+
+    slide_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" '
+        'Target="../slideLayouts/slideLayout1.xml"/>'
+        "</Relationships>"
+    )
+
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/ppt/presentation.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"/>'
+        '<Override PartName="/ppt/slideMasters/slideMaster1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml"/>'
+        '<Override PartName="/ppt/slideLayouts/slideLayout1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml"/>'
+        "</Types>"
+    )
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as zout:
+        zout.writestr("ppt/presentation.xml", presentation)
+        zout.writestr("ppt/_rels/presentation.xml.rels", pres_rels)
+        zout.writestr("ppt/slides/slide1.xml", slide1)
+        zout.writestr("ppt/slides/slide2.xml", slide2)
+        zout.writestr("ppt/slides/_rels/slide1.xml.rels", slide_rels)
+        zout.writestr("ppt/slides/_rels/slide2.xml.rels", slide_rels)
+        zout.writestr("ppt/slideMasters/slideMaster1.xml", master)
+        zout.writestr("ppt/slideMasters/_rels/slideMaster1.xml.rels", master_rels)
+        zout.writestr("ppt/slideLayouts/slideLayout1.xml", layout)
+        zout.writestr("[Content_Types].xml", content_types)
+    return out.getvalue()
+
+
+def build_deck() -> bytes:
+    presentation_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<p:presentation xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<p:sldIdLst><p:sldId id="256" r:id="rId1"/></p:sldIdLst>'
+        "</p:presentation>"
+    )
+    presentation_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide" '
+        'Target="slides/slide1.xml"/>'
+        "</Relationships>"
+    )
+    slide_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        "<p:cSld>"
+        '<p:bg><p:bgPr><a:solidFill><a:srgbClr val="FF0000"/></a:solidFill></p:bgPr></p:bg>'
+        "<p:spTree>"
+        "<p:sp>"
+        '<p:nvSpPr><p:cNvPr id="2" name="Title"/></p:nvSpPr>'
+        '<p:spPr><a:solidFill><a:schemeClr val="accent1"/></a:solidFill></p:spPr>'
+        "<p:txBody>"
+        "<a:bodyPr/>"
+        '<a:p><a:r><a:rPr><a:solidFill><a:srgbClr val="00FF00"/></a:solidFill></a:rPr>'
+        "<a:t>Hello</a:t></a:r></a:p>"
+        "</p:txBody>"
+        "</p:sp>"
+        "</p:spTree>"
+        "</p:cSld>"
+        "</p:sld>"
+    )
+    layout_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<p:sldLayout xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        "<p:cSld><p:spTree/></p:cSld>"
+        "</p:sldLayout>"
+    )
+    layout_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster" '
+        'Target="../slideMasters/slideMaster1.xml"/>'
+        "</Relationships>"
+    )
+    slide_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" '
+        'Target="../slideLayouts/slideLayout1.xml"/>'
+        "</Relationships>"
+    )
+    master_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<p:sldMaster xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        "<p:cSld><p:spTree/></p:cSld>"
+        "</p:sldMaster>"
+    )
+    master_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" '
+        'Target="../slideLayouts/slideLayout1.xml"/>'
+        "</Relationships>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/ppt/presentation.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"/>'
+        '<Override PartName="/ppt/slides/slide1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slide+xml"/>'
+        '<Override PartName="/ppt/slideLayouts/slideLayout1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml"/>'
+        '<Override PartName="/ppt/slideMasters/slideMaster1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml"/>'
+        "</Types>"
+    )
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as zout:
+        zout.writestr("ppt/presentation.xml", presentation_xml)
+        zout.writestr("ppt/_rels/presentation.xml.rels", presentation_rels)
+        zout.writestr("ppt/slides/slide1.xml", slide_xml)
+        zout.writestr("ppt/slides/_rels/slide1.xml.rels", slide_rels)
+        zout.writestr("ppt/slideLayouts/slideLayout1.xml", layout_xml)
+        zout.writestr("ppt/slideLayouts/_rels/slideLayout1.xml.rels", layout_rels)
+        zout.writestr("ppt/slideMasters/slideMaster1.xml", master_xml)
+        zout.writestr("ppt/slideMasters/_rels/slideMaster1.xml.rels", master_rels)
+        zout.writestr("[Content_Types].xml", content_types)
+    return out.getvalue()
+
+
+def build_slide_pkg() -> bytes:
+    slide_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        "<p:cSld>"
+        "<p:bg><p:bgPr><a:effectLst/></p:bgPr></p:bg>"
+        "<p:spTree>"
+        "<p:sp>"
+        "<p:txBody>"
+        "<a:bodyPr/>"
+        "<a:p><a:r><a:t>Hello</a:t></a:r></a:p>"
+        "</p:txBody>"
+        "</p:sp>"
+        "</p:spTree>"
+        "</p:cSld>"
+        "</p:sld>"
+    )
+    presentation_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<p:presentation xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<p:sldIdLst><p:sldId id="256" r:id="rId1"/></p:sldIdLst>'
+        "</p:presentation>"
+    )
+    presentation_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide" '
+        'Target="slides/slide1.xml"/>'
+        "</Relationships>"
+    )
+    slide_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>'
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/ppt/presentation.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"/>'
+        '<Override PartName="/ppt/slides/slide1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slide+xml"/>'
+        "</Types>"
+    )
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as zout:
+        zout.writestr("ppt/presentation.xml", presentation_xml)
+        zout.writestr("ppt/_rels/presentation.xml.rels", presentation_rels)
+        zout.writestr("ppt/slides/slide1.xml", slide_xml)
+        zout.writestr("ppt/slides/_rels/slide1.xml.rels", slide_rels)
+        zout.writestr("[Content_Types].xml", content_types)
+    return out.getvalue()
+
+
 def _theme_xml() -> str:
     return (
         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
@@ -68,7 +68,7 @@ def _minimal_pptx() -> bytes:
     )
 
     out = io.BytesIO()
-    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as zout:
         zout.writestr("ppt/presentation.xml", presentation)
         zout.writestr("ppt/_rels/presentation.xml.rels", rels)
         zout.writestr("ppt/slides/slide1.xml", slide1)
@@ -1,119 +1,11 @@
 from __future__ import annotations
 
-import io
-import zipfile
-
 from potxkit.dump_tree import DumpTreeOptions, dump_tree, summarize_tree
 from potxkit.package import OOXMLPackage
 
 
-def _build_deck() -> bytes:
-    presentation_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<p:presentation xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        '<p:sldIdLst><p:sldId id="256" r:id="rId1"/></p:sldIdLst>'
-        "</p:presentation>"
-    )
-    presentation_rels = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" '
-        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide" '
-        'Target="slides/slide1.xml"/>'
-        "</Relationships>"
-    )
-    slide_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
-        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        "<p:cSld>"
-        '<p:bg><p:bgPr><a:solidFill><a:srgbClr val="FF0000"/></a:solidFill></p:bgPr></p:bg>'
-        "<p:spTree>"
-        "<p:sp>"
-        '<p:nvSpPr><p:cNvPr id="2" name="Title"/></p:nvSpPr>'
-        '<p:spPr><a:solidFill><a:schemeClr val="accent1"/></a:solidFill></p:spPr>'
-        "<p:txBody>"
-        "<a:bodyPr/>"
-        '<a:p><a:r><a:rPr><a:solidFill><a:srgbClr val="00FF00"/></a:solidFill></a:rPr>'
-        "<a:t>Hello</a:t></a:r></a:p>"
-        "</p:txBody>"
-        "</p:sp>"
-        "</p:spTree>"
-        "</p:cSld>"
-        "</p:sld>"
-    )
-    layout_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<p:sldLayout xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
-        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
-        "<p:cSld><p:spTree/></p:cSld>"
-        "</p:sldLayout>"
-    )
-    layout_rels = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" '
-        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster" '
-        'Target="../slideMasters/slideMaster1.xml"/>'
-        "</Relationships>"
-    )
-    slide_rels = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" '
-        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" '
-        'Target="../slideLayouts/slideLayout1.xml"/>'
-        "</Relationships>"
-    )
-    master_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<p:sldMaster xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
-        'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
-        "<p:cSld><p:spTree/></p:cSld>"
-        "</p:sldMaster>"
-    )
-    master_rels = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" '
-        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" '
-        'Target="../slideLayouts/slideLayout1.xml"/>'
-        "</Relationships>"
-    )
-    content_types = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
-        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
-        '<Default Extension="xml" ContentType="application/xml"/>'
-        '<Override PartName="/ppt/presentation.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"/>'
-        '<Override PartName="/ppt/slides/slide1.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slide+xml"/>'
-        '<Override PartName="/ppt/slideLayouts/slideLayout1.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml"/>'
-        '<Override PartName="/ppt/slideMasters/slideMaster1.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml"/>'
-        "</Types>"
-    )
-
-    out = io.BytesIO()
-    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zout:
-        zout.writestr("ppt/presentation.xml", presentation_xml)
-        zout.writestr("ppt/_rels/presentation.xml.rels", presentation_rels)
-        zout.writestr("ppt/slides/slide1.xml", slide_xml)
-        zout.writestr("ppt/slides/_rels/slide1.xml.rels", slide_rels)
-        zout.writestr("ppt/slideLayouts/slideLayout1.xml", layout_xml)
-        zout.writestr("ppt/slideLayouts/_rels/slideLayout1.xml.rels", layout_rels)
-        zout.writestr("ppt/slideMasters/slideMaster1.xml", master_xml)
-        zout.writestr("ppt/slideMasters/_rels/slideMaster1.xml.rels", master_rels)
-        zout.writestr("[Content_Types].xml", content_types)
-    return out.getvalue()
-
-
-def test_dump_tree_includes_background_and_shapes() -> None:
-    pkg = OOXMLPackage(_build_deck())
+def test_dump_tree_includes_background_and_shapes(deck_bytes: bytes) -> None:
+    pkg = OOXMLPackage(deck_bytes)
     payload = dump_tree(
         pkg,
         options=DumpTreeOptions(
@@ -137,8 +29,8 @@ def test_dump_tree_includes_background_and_shapes() -> None:
     assert slide["slideMaster"]["part"] == "ppt/slideMasters/slideMaster1.xml"
 
 
-def test_dump_tree_summary_includes_local() -> None:
-    pkg = OOXMLPackage(_build_deck())
+def test_dump_tree_summary_includes_local(deck_bytes: bytes) -> None:
+    pkg = OOXMLPackage(deck_bytes)
     payload = dump_tree(
         pkg,
         options=DumpTreeOptions(
@@ -150,8 +42,8 @@ def test_dump_tree_summary_includes_local() -> None:
     assert any("local:" in line for line in lines)
 
 
-def test_dump_tree_summary_local_only_filters() -> None:
-    pkg = OOXMLPackage(_build_deck())
+def test_dump_tree_summary_local_only_filters(deck_bytes: bytes) -> None:
+    pkg = OOXMLPackage(deck_bytes)
     payload = dump_tree(
         pkg,
         options=DumpTreeOptions(
@@ -160,3 +52,53 @@ def test_dump_tree_summary_local_only_filters() -> None:
     )
     lines = summarize_tree(payload, local_only=True)
     assert any(line.startswith("slide 1:") for line in lines)
+
+
+def test_dump_tree_layers_are_not_shared_between_slides(deck_bytes: bytes) -> None:
+    pkg = OOXMLPackage(deck_bytes)
+    _add_second_slide(pkg)
+    payload = dump_tree(pkg, options=DumpTreeOptions(include_layout=True))
+
+    first, second = payload["slides"]
+    assert first["layout_tree"] == second["layout_tree"]
+    first["layout_tree"]["shapes"].append({"kind": "sp"})
+    assert second["layout_tree"]["shapes"] == []
+
+
+def test_dump_tree_summary_repeats_shared_layer_lines(deck_bytes: bytes) -> None:
+    pkg = OOXMLPackage(deck_bytes)
+    _add_second_slide(pkg)
+    payload = dump_tree(
+        pkg,
+        options=DumpTreeOptions(include_layout=True, include_master=True, grouped=True),
+    )
+    lines = summarize_tree(payload)
+    layout_lines = [line for line in lines if line.startswith("  slideLayout:")]
+    local_lines = [line for line in lines if line.startswith("  local:")]
+    assert len(layout_lines) == 2 and layout_lines[0] == layout_lines[1]
+    assert len(local_lines) == 2
+
+
+def _add_second_slide(pkg: OOXMLPackage) -> None:
+    pkg.write_part("ppt/slides/slide2.xml", pkg.read_part("ppt/slides/slide1.xml"))
+    pkg.write_part(
+        "ppt/slides/_rels/slide2.xml.rels",
+        pkg.read_part("ppt/slides/_rels/slide1.xml.rels"),
+    )
+    rels = pkg.read_part("ppt/_rels/presentation.xml.rels").decode()
+    pkg.write_part(
+        "ppt/_rels/presentation.xml.rels",
+        rels.replace(
+            "</Relationships>",
+            '<Relationship Id="rId2" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/slide" Target="slides/slide2.xml"/></Relationships>',
+        ).encode(),
+    )
+    presentation = pkg.read_part("ppt/presentation.xml").decode()
+    pkg.write_part(
+        "ppt/presentation.xml",
+        presentation.replace(
+            "</p:sldIdLst>", '<p:sldId id="257" r:id="rId2"/></p:sldIdLst>'
+        ).encode(),
+    )
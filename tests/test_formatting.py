@@ -4,6 +4,8 @@ import xml.etree.ElementTree as ET
 
 from potxkit.formatting import (
     apply_color_mapping,
+    color_mapping_pattern,
+    has_srgb_colors,
     set_text_font_family,
     strip_hardcoded_colors,
     strip_inline_formatting,
@@ -20,6 +22,19 @@ def test_apply_color_mapping() -> None:
     assert root.find(f".//{{{A_NS}}}schemeClr") is not None
 
 
+def test_has_srgb_colors_prefilter() -> None:
+    assert has_srgb_colors(b'<a:solidFill><a:srgbClr val="FF0000"/></a:solidFill>')
+    assert not has_srgb_colors(
+        b'<a:solidFill><a:schemeClr val="accent1"/></a:solidFill>'
+    )
+
+
+def test_color_mapping_pattern_matches_case_insensitively() -> None:
+    pattern = color_mapping_pattern({"FF0000": "accent1", "0D0D14": "dk1"})
+    assert pattern.search(b'<a:srgbClr val="ff0000"/>')
+    assert not pattern.search(b'<a:srgbClr val="00FF00"/>')
+
+
 def test_strip_hardcoded_colors() -> None:
     root = ET.fromstring(
         f'<a:solidFill xmlns:a="{A_NS}"><a:srgbClr val="FF0000"/></a:solidFill>'
@@ -36,6 +51,16 @@ def test_strip_inline_formatting() -> None:
     assert root.find(f".//{{{A_NS}}}rPr") is None
 
 
+def test_strip_inline_formatting_counts_list_style_once() -> None:
+    root = ET.fromstring(
+        f'<a:txBody xmlns:a="{A_NS}"><a:lstStyle><a:lvl1pPr>'
+        '<a:buClr/><a:defRPr sz="2000"/></a:lvl1pPr></a:lstStyle>'
+        "<a:p><a:r><a:rPr/></a:r></a:p></a:txBody>"
+    )
+    assert strip_inline_formatting(root) == 3
+    assert root.find(f".//{{{A_NS}}}lstStyle") is None
+
+
 def test_set_text_font_family() -> None:
     root = ET.fromstring(f'<a:p xmlns:a="{A_NS}"><a:r><a:rPr/></a:r></a:p>')
     assert set_text_font_family(root, "Aptos") == 1
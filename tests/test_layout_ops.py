@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from potxkit.layout_ops import edit_part_formatting
+from potxkit.package import OOXMLPackage
+
+
+def test_edit_part_formatting_applies_all_edits_in_one_write(
+    minimal_pptx_bytes: bytes, record_writes: Callable[[OOXMLPackage], list[str]]
+) -> None:
+    pkg = OOXMLPackage(minimal_pptx_bytes)
+    writes = record_writes(pkg)
+    changes = edit_part_formatting(
+        pkg,
+        "ppt/slides/slide1.xml",
+        palette={"111111": "accent1"},
+        font="Aptos",
+        strip_fonts=True,
+    )
+    assert changes == 1
+    assert writes == ["ppt/slides/slide1.xml"]
+    assert b"schemeClr" in pkg.read_part("ppt/slides/slide1.xml")
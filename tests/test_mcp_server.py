@@ -4,10 +4,10 @@ import json
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import conftest
 import pytest
 from fastmcp import Client
 
+from potxkit import PotxTemplate
 from potxkit.mcp_server import mcp
 
 
@@ -41,9 +41,11 @@ async def test_mcp_list_tools_includes_core(mcp_client) -> None:
         assert expected in names
 
 
-async def test_mcp_dump_theme_and_validate(tmp_path: Path, mcp_client) -> None:
+async def test_mcp_dump_theme_and_validate(
+    tmp_path: Path, mcp_client, minimal_potx_bytes: bytes
+) -> None:
     src = tmp_path / "sample.potx"
-    src.write_bytes(conftest.build_minimal_potx())
+    src.write_bytes(minimal_potx_bytes)
 
     result = await mcp_client.call_tool(
         name="dump_theme", arguments={"path": str(src), "pretty": True}
@@ -55,10 +57,12 @@ async def test_mcp_dump_theme_and_validate(tmp_path: Path, mcp_client) -> None:
     assert result.data["ok"] is True
 
 
-async def test_mcp_set_theme_names(tmp_path: Path, mcp_client) -> None:
+async def test_mcp_set_theme_names(
+    tmp_path: Path, mcp_client, minimal_potx_bytes: bytes
+) -> None:
     src = tmp_path / "sample.potx"
     out = tmp_path / "named.potx"
-    src.write_bytes(conftest.build_minimal_potx())
+    src.write_bytes(minimal_potx_bytes)
 
     result = await mcp_client.call_tool(
         name="set_theme_names",
@@ -72,3 +76,89 @@ async def test_mcp_set_theme_names(tmp_path: Path, mcp_client) -> None:
     )
     assert out.exists()
     assert result.data == str(out)
+
+
+async def test_mcp_batch_runs_ops_on_one_package(
+    tmp_path: Path, mcp_client, minimal_potx_bytes: bytes
+) -> None:
+    src = tmp_path / "sample.potx"
+    out = tmp_path / "batched.potx"
+    src.write_bytes(minimal_potx_bytes)
+
+    result = await mcp_client.call_tool(
+        name="batch",
+        arguments={
+            "input_path": str(src),
+            "output": str(out),
+            "ops": [
+                {"tool": "sanitize", "args": {}},
+                {"tool": "set_theme_names", "args": {"theme": "Batched"}},
+            ],
+        },
+    )
+    assert result.data["output"] == str(out)
+    assert [step["tool"] for step in result.data["results"]] == [
+        "sanitize",
+        "set_theme_names",
+    ]
+    assert PotxTemplate.open(str(out)).theme.get_name() == "Batched"
+
+    result = await mcp_client.call_tool(name="validate", arguments={"path": str(out)})
+    assert result.data["ok"] is True
+
+
+async def test_mcp_batch_reports_invalid_op_index(
+    tmp_path: Path, mcp_client, minimal_potx_bytes: bytes
+) -> None:
+    src = tmp_path / "sample.potx"
+    out = tmp_path / "batched.potx"
+    src.write_bytes(minimal_potx_bytes)
+
+    result = await mcp_client.call_tool(
+        name="batch",
+        arguments={
+            "input_path": str(src),
+            "output": str(out),
+            "ops": [
+                {"tool": "sanitize", "args": {}},
+                {"tool": "sanitize", "args": {"slide": "1"}},
+            ],
+        },
+    )
+    error = result.data["error"]
+    assert error["index"] == 1
+    assert error["tool"] == "sanitize"
+    assert "slide" in error["message"]
+    assert not out.exists()
+
+    result = await mcp_client.call_tool(
+        name="batch",
+        arguments={"input_path": str(src), "output": str(out), "ops": [{"tool": "x"}]},
+    )
+    assert result.data["error"]["index"] == 0
+    assert not out.exists()
+
+
+async def test_mcp_batch_reports_op_failing_mid_run(
+    tmp_path: Path, mcp_client, minimal_potx_bytes: bytes
+) -> None:
+    src = tmp_path / "sample.potx"
+    out = tmp_path / "batched.potx"
+    src.write_bytes(minimal_potx_bytes)
+
+    result = await mcp_client.call_tool(
+        name="batch",
+        arguments={
+            "input_path": str(src),
+            "output": str(out),
+            "ops": [
+                {"tool": "reindex_layouts", "args": {}},
+                {"tool": "sanitize", "args": {"slides": 5}},
+            ],
+        },
+    )
+    error = result.data["error"]
+    assert error["index"] == 1
+    assert error["tool"] == "sanitize"
+    assert error["message"].startswith("AttributeError")
+    assert not out.exists()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import io
+import zipfile
+import zlib
+
+import pytest
+
+from potxkit import package
+from potxkit.content_types import ensure_override, has_override, remove_override
+from potxkit.package import OOXMLPackage
+from potxkit.rels import Relationship, read_relationships, write_relationships
+from potxkit.slide_index import slide_parts_in_order
+from potxkit.storage import save_package
+
+
+def test_parts_are_decompressed_on_first_read() -> None:
+    source = io.BytesIO()
+    with zipfile.ZipFile(source, "w") as zout:
+        zout.writestr("good.xml", b"<good/>", compress_type=zipfile.ZIP_STORED)
+        zout.writestr("bad.xml", b"<bad/>", compress_type=zipfile.ZIP_STORED)
+    data = source.getvalue().replace(b"<bad/>", b"<BAD/>", 1)
+
+    pkg = OOXMLPackage(data)
+    assert pkg.has_part("bad.xml")
+    first = pkg.read_part("/good.xml")
+    assert first == b"<good/>"
+    assert pkg.read_part("good.xml") is first
+    with pytest.raises(zipfile.BadZipFile):
+        pkg.read_part("bad.xml")
+
+
+def test_save_bytes_roundtrips_written_and_deleted_parts(
+    minimal_potx_bytes: bytes,
+) -> None:
+    with OOXMLPackage(minimal_potx_bytes) as pkg:
+        pkg.write_part("ppt/custom.xml", b"<custom/>")
+        pkg.delete_part("ppt/presentation.xml")
+        data = pkg.save_bytes()
+
+    reopened = OOXMLPackage(data)
+    assert reopened.read_part("ppt/custom.xml") == b"<custom/>"
+    assert not reopened.has_part("ppt/presentation.xml")
+    assert reopened.list_parts() == [
+        "ppt/theme/theme1.xml",
+        "ppt/_rels/presentation.xml.rels",
+        "[Content_Types].xml",
+        "ppt/custom.xml",
+    ]
+
+
+def test_save_bytes_copies_unchanged_entries_verbatim() -> None:
+    source = io.BytesIO()
+    with zipfile.ZipFile(source, "w") as zout:
+        zout.writestr("stored.xml", b"<stored/>", compress_type=zipfile.ZIP_STORED)
+        zout.writestr("deflated.xml", b"<a>" * 200, compress_type=zipfile.ZIP_DEFLATED)
+
+    pkg = OOXMLPackage(source.getvalue())
+    pkg.read_part("deflated.xml")
+    pkg.write_part("ppt/media/image1.png", b"\x89PNG")
+    data = pkg.save_bytes()
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zin:
+        infos = {info.filename: info for info in zin.infolist()}
+        assert infos["stored.xml"].compress_type == zipfile.ZIP_STORED
+        assert infos["deflated.xml"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["ppt/media/image1.png"].compress_type == zipfile.ZIP_STORED
+        assert zin.read("deflated.xml") == b"<a>" * 200
+        assert zin.read("ppt/media/image1.png") == b"\x89PNG"
+        assert zin.testzip() is None
+
+
+@pytest.mark.parametrize("raw_copy", [True, False])
+def test_copied_entries_keep_valid_crcs(
+    monkeypatch: pytest.MonkeyPatch, minimal_potx_bytes: bytes, raw_copy: bool
+) -> None:
+    if not raw_copy:
+        monkeypatch.setattr(package, "_can_copy_raw", lambda zout: False)
+    pkg = OOXMLPackage(minimal_potx_bytes)
+    pkg.write_part("ppt/custom.xml", b"<custom/>")
+    data = pkg.save_bytes()
+
+    with zipfile.ZipFile(io.BytesIO(minimal_potx_bytes)) as source:
+        originals = {info.filename: info for info in source.infolist()}
+    with zipfile.ZipFile(io.BytesIO(data)) as zin:
+        assert zin.testzip() is None
+        for name, original in originals.items():
+            copied = zin.getinfo(name)
+            assert copied.CRC == original.CRC
+            assert copied.compress_type == original.compress_type
+            assert zlib.crc32(zin.read(name)) == original.CRC
+
+
+def test_slide_order_is_rebuilt_only_after_structural_writes(
+    minimal_potx_bytes: bytes,
+) -> None:
+    pkg = OOXMLPackage(minimal_potx_bytes)
+    builds: list[int] = []
+
+    def build() -> list[str]:
+        builds.append(1)
+        return slide_parts_in_order(OOXMLPackage(pkg.save_bytes()))
+
+    pkg.write_part("ppt/slides/slide1.xml", b"<sld/>")
+    assert pkg.slide_order(build) == ["ppt/slides/slide1.xml"]
+    assert slide_parts_in_order(pkg) == ["ppt/slides/slide1.xml"]
+    assert len(builds) == 1
+
+    pkg.write_part("ppt/slides/slide1.xml", b"<sld/>")
+    pkg.slide_order(build)
+    assert len(builds) == 1
+
+    pkg.write_part("ppt/slides/slide2.xml", b"<sld/>")
+    assert pkg.slide_order(build) == [
+        "ppt/slides/slide1.xml",
+        "ppt/slides/slide2.xml",
+    ]
+    assert len(builds) == 2
+
+    pkg.write_part("ppt/presentation.xml", pkg.read_part("ppt/presentation.xml"))
+    pkg.slide_order(build)
+    assert len(builds) == 3
+
+
+def test_parts_under_tracks_writes_and_deletes(minimal_potx_bytes: bytes) -> None:
+    pkg = OOXMLPackage(minimal_potx_bytes)
+    assert pkg.parts_under("ppt/theme/") == ["ppt/theme/theme1.xml"]
+    assert pkg.parts_under("ppt/media/") == []
+
+    pkg.write_part("ppt/media/image1.png", b"\x89PNG")
+    pkg.write_part("ppt/media/image2.png", b"\x89PNG")
+    pkg.delete_part("ppt/media/image1.png")
+    assert pkg.parts_under("ppt/media/") == ["ppt/media/image2.png"]
+    assert pkg.parts_under("ppt/media/image") == ["ppt/media/image2.png"]
+    assert pkg.parts_under("ppt/") == sorted(
+        name for name in pkg.list_parts() if name.startswith("ppt/")
+    )
+    assert pkg.parts_under("ppt/_rels/") == ["ppt/_rels/presentation.xml.rels"]
+
+
+def test_save_to_streams_the_same_archive_as_save_bytes(
+    tmp_path, minimal_potx_bytes: bytes
+) -> None:
+    pkg = OOXMLPackage(minimal_potx_bytes)
+    pkg.write_part("ppt/custom.xml", b"<custom/>")
+    target = tmp_path / "out.potx"
+    with target.open("wb") as handle:
+        pkg.save_to(handle)
+    reopened = OOXMLPackage(target.read_bytes())
+    assert reopened.list_parts() == pkg.list_parts()
+    assert reopened.read_part("ppt/custom.xml") == b"<custom/>"
+
+
+def test_override_lookup_is_cached_until_content_types_change(
+    minimal_potx_bytes: bytes,
+) -> None:
+    pkg = OOXMLPackage(minimal_potx_bytes)
+    assert has_override(pkg, "/ppt/presentation.xml")
+    assert not has_override(pkg, "/ppt/custom.xml")
+
+    assert ensure_override(pkg, "ppt/custom.xml", "application/xml")
+    assert has_override(pkg, "/ppt/custom.xml")
+    assert not ensure_override(pkg, "/ppt/custom.xml", "application/xml")
+
+    assert remove_override(pkg, "/ppt/custom.xml")
+    assert not has_override(pkg, "/ppt/custom.xml")
+
+
+def test_save_stores_tiny_written_parts_uncompressed(
+    minimal_potx_bytes: bytes,
+) -> None:
+    pkg = OOXMLPackage(minimal_potx_bytes)
+    pkg.write_part("ppt/tiny.xml", b"<tiny/>")
+    pkg.write_part("ppt/large.xml", b"<large>" + b"x" * 512 + b"</large>")
+    with zipfile.ZipFile(io.BytesIO(pkg.save_bytes())) as zf:
+        assert zf.getinfo("ppt/tiny.xml").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("ppt/large.xml").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_read_relationships_returns_fresh_copies_until_rewritten(
+    minimal_potx_bytes: bytes,
+) -> None:
+    pkg = OOXMLPackage(minimal_potx_bytes)
+    rels_part = "ppt/_rels/presentation.xml.rels"
+    first = read_relationships(pkg, rels_part)
+    first[0].target = "changed.xml"
+    assert read_relationships(pkg, rels_part)[0].target != "changed.xml"
+
+    extra = Relationship(id="rId99", type="urn:test", target="custom.xml")
+    write_relationships(pkg, "ppt/presentation.xml", [*first, extra])
+    assert read_relationships(pkg, rels_part)[-1] == extra
+
+
+def test_save_package_leaves_destination_intact_on_failure(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, minimal_potx_bytes: bytes
+) -> None:
+    target = tmp_path / "deck.potx"
+    target.write_bytes(minimal_potx_bytes)
+    pkg = OOXMLPackage(target.read_bytes())
+
+    def fail(fp) -> None:
+        fp.write(b"partial")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(pkg, "save_to", fail)
+    with pytest.raises(RuntimeError):
+        save_package(pkg, str(target))
+    assert target.read_bytes() == minimal_potx_bytes
+    assert [path.name for path in tmp_path.iterdir()] == ["deck.potx"]
+
+    monkeypatch.undo()
+    pkg.write_part("ppt/custom.xml", b"<custom/>")
+    save_package(pkg, str(target))
+    assert OOXMLPackage(target.read_bytes()).read_part("ppt/custom.xml") == (
+        b"<custom/>"
+    )
+    assert [path.name for path in tmp_path.iterdir()] == ["deck.potx"]
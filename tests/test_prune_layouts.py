@@ -4,7 +4,7 @@ import io
 import xml.etree.ElementTree as ET
 import zipfile
 
-from potxkit.layout_ops import prune_unused_layouts
+from potxkit.layout_ops import make_layout_from_slide, prune_unused_layouts
 from potxkit.package import OOXMLPackage
 from potxkit.rels import parse_relationships
 
@@ -87,7 +87,7 @@ def _build_minimal_deck() -> bytes:
     )
 
     out = io.BytesIO()
-    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as zout:
         zout.writestr("ppt/presentation.xml", presentation_xml)
         zout.writestr("ppt/_rels/presentation.xml.rels", presentation_rels)
         zout.writestr("ppt/slides/slide1.xml", slide_xml)
@@ -105,6 +105,7 @@ def test_prune_unused_layouts_removes_layout_and_master_refs() -> None:
 
     result = prune_unused_layouts(pkg)
     assert "ppt/slideLayouts/slideLayout2.xml" in result.removed_layouts
+    assert result.masters_updated == 1
     assert pkg.has_part("ppt/slideLayouts/slideLayout1.xml")
     assert not pkg.has_part("ppt/slideLayouts/slideLayout2.xml")
 
@@ -132,3 +133,39 @@ def test_prune_unused_layouts_removes_layout_and_master_refs() -> None:
         )
     ]
     assert "/ppt/slideLayouts/slideLayout2.xml" not in overrides
+
+
+def test_prune_unused_layouts_counts_each_removed_layout_per_master() -> None:
+    pkg = OOXMLPackage(_build_minimal_deck())
+    pkg.delete_part("ppt/slides/_rels/slide1.xml.rels")
+
+    result = prune_unused_layouts(pkg)
+    assert result.removed_layouts == [
+        "ppt/slideLayouts/slideLayout1.xml",
+        "ppt/slideLayouts/slideLayout2.xml",
+    ]
+    assert result.masters_updated == 2
+
+
+def test_make_layout_from_slide_links_new_layout_into_master() -> None:
+    pkg = OOXMLPackage(_build_minimal_deck())
+
+    layout_part = make_layout_from_slide(pkg, 1, "From Slide")
+    assert layout_part == "ppt/slideLayouts/slideLayout3.xml"
+
+    rels = parse_relationships(
+        pkg.read_part("ppt/slideMasters/_rels/slideMaster1.xml.rels")
+    )
+    new_rel = next(
+        rel for rel in rels if rel.target == "../slideLayouts/slideLayout3.xml"
+    )
+
+    master_root = ET.fromstring(pkg.read_part("ppt/slideMasters/slideMaster1.xml"))
+    r_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    layout_ids = {
+        node.attrib.get(f"{{{r_ns}}}id"): node.attrib.get("id")
+        for node in master_root.findall(
+            ".//{http://schemas.openxmlformats.org/presentationml/2006/main}sldLayoutId"
+        )
+    }
+    assert layout_ids[new_rel.id] == "258"
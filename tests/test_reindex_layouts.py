@@ -96,7 +96,7 @@ def _build_deck_with_gapped_layouts() -> bytes:
     )
 
     out = io.BytesIO()
-    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED) as zout:
         zout.writestr("ppt/presentation.xml", presentation_xml)
         zout.writestr("ppt/_rels/presentation.xml.rels", presentation_rels)
         zout.writestr("ppt/slides/slide1.xml", slide_xml)
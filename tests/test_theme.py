@@ -1,25 +1,27 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
+from typing import Callable
 
 from conftest import build_minimal_potx
 
 from potxkit import PotxTemplate
+from potxkit.package import OOXMLPackage
 from potxkit.rels import parse_relationships
+from potxkit.theme import COLOR_SLOTS, Theme
 
 
-def test_theme_edit_roundtrip(tmp_path: Path) -> None:
-    base = tmp_path / "base.potx"
-    base.write_bytes(build_minimal_potx())
-
-    tpl = PotxTemplate.open(str(base))
+def test_theme_edit_roundtrip(minimal_potx_bytes: bytes) -> None:
+    tpl = PotxTemplate.open(io.BytesIO(minimal_potx_bytes))
     tpl.theme.colors.set_accent(1, "#112233")
     tpl.theme.fonts.set_major("Aptos Display")
 
-    out = tmp_path / "out.potx"
-    tpl.save(str(out))
+    buf = io.BytesIO()
+    tpl.save(buf)
+    buf.seek(0)
 
-    reopened = PotxTemplate.open(str(out))
+    reopened = PotxTemplate.open(buf)
     assert reopened.theme.colors.get_accent(1) == "#112233"
     assert reopened.theme.fonts.get_major().latin == "Aptos Display"
 
@@ -27,16 +29,14 @@ def test_theme_edit_roundtrip(tmp_path: Path) -> None:
     assert report.ok
 
 
-def test_save_adds_theme_relationship(tmp_path: Path) -> None:
-    base = tmp_path / "base.potx"
-    base.write_bytes(build_minimal_potx(include_theme_rel=False))
-
-    tpl = PotxTemplate.open(str(base))
-    out = tmp_path / "out.potx"
-    tpl.save(str(out))
+def test_save_adds_theme_relationship() -> None:
+    tpl = PotxTemplate.open(io.BytesIO(build_minimal_potx(include_theme_rel=False)))
+    buf = io.BytesIO()
+    tpl.save(buf)
+    buf.seek(0)
 
     rels_path = "ppt/_rels/presentation.xml.rels"
-    rels_data = PotxTemplate.open(str(out))._package.read_part(rels_path)
+    rels_data = PotxTemplate.open(buf).package.read_part(rels_path)
     relationships = parse_relationships(rels_data)
     assert any(
         rel.type
@@ -54,3 +54,62 @@ def test_new_template_roundtrip(tmp_path: Path) -> None:
 
     reopened = PotxTemplate.open(str(out))
     assert reopened.theme.colors.get_accent(2) == "#123456"
+
+
+def test_colors_as_dict_matches_slot_getters() -> None:
+    colors = PotxTemplate.new().theme.colors
+    colors.set_accent(3, "#abcdef")
+    payload = colors.as_dict()
+    assert list(payload) == list(COLOR_SLOTS)
+    assert payload["accent3"] == "#ABCDEF"
+    assert payload["dk1"] == colors.get_dark1()
+    assert payload["folHlink"] == colors.get_followed_hyperlink()
+
+
+def test_save_skips_unchanged_theme_write(
+    tmp_path: Path, record_writes: Callable[[OOXMLPackage], list[str]]
+) -> None:
+    tpl = PotxTemplate.new()
+    tpl.theme.colors.set_accent(1, "#123456")
+    tpl.save(str(tmp_path / "first.potx"))
+
+    writes = record_writes(tpl.package)
+    tpl.save(str(tmp_path / "second.potx"))
+    assert writes == []
+    assert PotxTemplate.open(str(tmp_path / "second.potx")).validate().ok
+
+
+def test_theme_from_bytes_returns_independent_trees() -> None:
+    data = PotxTemplate.new().theme.to_bytes()
+    first = Theme.from_bytes(data)
+    first.colors.set_accent(1, "#010203")
+    second = Theme.from_bytes(data)
+    assert second.colors.get_accent(1) != "#010203"
+    assert first.colors.get_accent(1) == "#010203"
+
+
+def test_open_and_save_accept_paths(tmp_path: Path, minimal_potx_bytes: bytes) -> None:
+    src = tmp_path / "in.potx"
+    out = tmp_path / "out.potx"
+    src.write_bytes(minimal_potx_bytes)
+
+    tpl = PotxTemplate.open(src)
+    tpl.theme.set_name("From Path")
+    tpl.save(out)
+    assert PotxTemplate.open(out).theme.get_name() == "From Path"
+
+
+def test_open_and_save_accept_file_objects(
+    tmp_path: Path, minimal_potx_bytes: bytes
+) -> None:
+    src = tmp_path / "in.potx"
+    src.write_bytes(minimal_potx_bytes)
+
+    with src.open("rb") as handle:
+        tpl = PotxTemplate.open(handle)
+    tpl.theme.set_name("From Handle")
+    out = tmp_path / "out.potx"
+    with out.open("wb") as handle:
+        tpl.save(handle)
+    with out.open("rb") as handle:
+        assert PotxTemplate.open(handle).theme.get_name() == "From Handle"
@@ -3,7 +3,9 @@ from __future__ import annotations
 import xml.etree.ElementTree as ET
 
 from potxkit.typography import (
+    apply_text_styles,
     detect_placeholder_styles,
+    extract_text_style_stats,
     set_layout_text_styles,
     set_master_text_styles,
 )
@@ -55,3 +57,32 @@ def test_set_master_text_styles() -> None:
     assert def_rpr is not None
     assert def_rpr.attrib.get("sz") == "3200"
     assert def_rpr.attrib.get("b") == "0"
+
+
+def test_extract_text_style_stats_counts_run_properties() -> None:
+    xml = (
+        f'<p:sld xmlns:p="{P_NS}" xmlns:a="{A_NS}">'
+        '<a:lvl1pPr><a:defRPr sz="2400" b="0"/></a:lvl1pPr>'
+        '<a:r><a:rPr sz="2400" b="1"/></a:r>'
+        '<a:r><a:rPr sz="x" b="1"/></a:r>'
+        "</p:sld>"
+    )
+    stats = extract_text_style_stats(ET.fromstring(xml))
+    assert stats.size_counts == {"2400": 2}
+    assert stats.bold_counts == {"1": 2, "0": 1}
+
+
+def test_apply_text_styles_updates_master_styles_and_placeholders() -> None:
+    xml = (
+        f'<p:sldMaster xmlns:p="{P_NS}" xmlns:a="{A_NS}">'
+        "<p:cSld><p:spTree>"
+        '<p:sp><p:nvSpPr><p:nvPr><p:ph type="body"/></p:nvPr></p:nvSpPr>'
+        "<p:txBody><a:bodyPr/><a:lstStyle/></p:txBody></p:sp>"
+        "</p:spTree></p:cSld>"
+        "<p:txStyles><p:bodyStyle><a:lvl1pPr/></p:bodyStyle></p:txStyles>"
+        "</p:sldMaster>"
+    )
+    root = ET.fromstring(xml)
+    assert apply_text_styles(root, None, None, 18, None) == 2
+    sizes = [node.attrib.get("sz") for node in root.iter(f"{{{A_NS}}}defRPr")]
+    assert sizes == ["1800", "1800"]